@@ -3,30 +3,42 @@ Thread-safe file-based cache with LRU eviction.
 
 Provides:
 - Atomic file writes (temp file + rename)
-- File locking for concurrent access
+- Lock-free reads (atomic rename means readers never see partial files)
 - LRU eviction when size limits exceeded
 - TTL enforcement for cache entries
 - Directory sharding for filesystem performance
+- In-memory LRU of parsed entries in front of the disk cache
 """
 
 import json
+import copy
 import hashlib
 import logging
 import os
+import re
+import tempfile
 import threading
 import time
-from dataclasses import dataclass, asdict, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List, Set, Tuple, Union
 
 from constants import (
     DEFAULT_CACHE_TTL_FOUND,
     DEFAULT_CACHE_TTL_NOT_FOUND,
     MAX_CACHE_SIZE_MB,
     MAX_CACHE_ENTRIES,
+    MEMORY_CACHE_ENTRIES,
+    MTIME_FLUSH_THRESHOLD,
+    CACHE_SCAN_WORKERS,
+    CACHE_FSYNC,
     CacheStatus,
 )
+from text_utils import sanitize_description
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,21 +46,125 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-# Try to import fcntl for file locking (Unix only)
+# Characters replaced with '_' in cache filenames. Unicode-aware: \w accepts
+# exactly what str.isalnum() does, plus '_'.
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w-]')
+
+# Cache key layout: {title-year prefix}-{imdb|none}[-{m|s}]
+# e.g. 'vpro-die-hard-1988-tt0095016-m', legacy 'vpro-die-hard-1988-none'
+_KEY_PATTERN = re.compile(r'^(?P<prefix>.+)-(?P<imdb>none|tt\d+)(?:-(?P<type>[ms]))?$')
+_TYPE_SUFFIXES = ("-m", "-s")
+
+# Process umask, read once (os.umask can only be queried by setting it).
+# mkstemp() creates files as 0600; cache files get the mode a plain open()
+# would give them instead, so the bind-mounted cache stays readable.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_CACHE_FILE_MODE = 0o666 & ~_UMASK
+
+# Try to import orjson for fast (de)serialization, fall back to stdlib json
 try:
-    import fcntl
-    HAS_FCNTL = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_FCNTL = False
-    logger.debug("fcntl not available, file locking disabled")
+    HAS_ORJSON = False
+    logger.debug("orjson not available, using stdlib json")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes (raises json.JSONDecodeError on bad input)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (no indentation)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=4096)
+def _shard_and_filename(key: str, legacy_hash: bool = False) -> Tuple[str, str]:
+    """
+    Compute shard directory name and filename for a cache key.
+
+    Memoized: the same keys are hashed repeatedly (exact, suffixed and
+    legacy candidates on every read).
+
+    Args:
+        key: Cache key
+        legacy_hash: Use the original SHA-256 layout (for reading old entries)
 
+    Returns:
+        Tuple of (shard_name, filename)
+    """
+    # Hash the key for sharding and filename safety (14 hex chars needed)
+    if legacy_hash:
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+    else:
+        key_hash = hashlib.blake2b(key.encode(), digest_size=7).hexdigest()
+
+    # Sanitize key for filename (keep it readable)
+    safe_key = _UNSAFE_FILENAME_CHARS.sub('_', key)[:80]
+
+    # Use first 2 chars of hash for shard directory
+    return key_hash[:2], f"{safe_key}_{key_hash[:12]}.json"
+
+
+def _parse_epoch(timestamp: str) -> float:
+    """
+    Convert an ISO format timestamp to epoch seconds.
+
+    Args:
+        timestamp: ISO format timestamp (timezone-aware)
+
+    Returns:
+        Epoch seconds, or 0.0 if missing, invalid or naive
+    """
+    try:
+        if not timestamp:
+            return 0.0
+        parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        if parsed.tzinfo is None:
+            return 0.0
+        return parsed.timestamp()
+    except (ValueError, AttributeError, TypeError):
+        return 0.0
+
+
+def _is_expired(status: str, fetched_epoch: float) -> bool:
+    """
+    Check whether an entry with the given status and fetch time has expired.
 
-@dataclass
+    Found entries have longer TTL (30 days) than not-found entries (1 hour).
+
+    Args:
+        status: CacheStatus value
+        fetched_epoch: Fetch time in epoch seconds (0.0 if unknown)
+
+    Returns:
+        True if entry has expired
+    """
+    if not fetched_epoch:
+        return True  # Missing or invalid timestamp = expired
+
+    age_seconds = time.time() - fetched_epoch
+
+    # Use shorter TTL for not-found entries
+    if status == CacheStatus.NOT_FOUND.value:
+        return age_seconds > DEFAULT_CACHE_TTL_NOT_FOUND
+    return age_seconds > DEFAULT_CACHE_TTL_FOUND
+
+
+@dataclass(slots=True)
 class CacheEntry:
     """
     Structured cache entry for metadata.
 
-    All fields are explicitly typed for validation.
+    All fields are explicitly typed for validation. Slotted to keep the
+    in-memory LRU compact and attribute access fast.
     Note: media_type field is kept for backward compatibility but is always "film".
     """
     title: str
@@ -68,36 +184,47 @@ class CacheEntry:
     content_rating: Optional[str] = None  # Kijkwijzer age rating (AL, 6, 9, 12, 14, 16, 18)
     vpro_rating: Optional[int] = None  # VPRO appreciation rating (1-10)
     images: Optional[List[Dict[str, str]]] = None  # [{type, url, title}]
+    # fetched_at as epoch seconds, parsed lazily (in-memory only, not serialized)
+    fetched_at_epoch: float = field(default=0.0, repr=False, compare=False)
 
     def is_expired(self) -> bool:
         """
         Check if this cache entry has expired based on TTL.
 
         Found entries have longer TTL (30 days) than not-found entries (1 hour).
+        The ISO timestamp is parsed once and kept as epoch seconds.
 
         Returns:
             True if entry has expired
         """
-        try:
-            if not self.fetched_at:
-                return True
-
-            fetched = datetime.fromisoformat(
-                self.fetched_at.replace('Z', '+00:00')
-            )
-            age_seconds = (datetime.now(timezone.utc) - fetched).total_seconds()
-
-            # Use shorter TTL for not-found entries
-            if self.status == CacheStatus.NOT_FOUND.value:
-                return age_seconds > DEFAULT_CACHE_TTL_NOT_FOUND
-            return age_seconds > DEFAULT_CACHE_TTL_FOUND
-
-        except (ValueError, AttributeError):
-            return True  # Invalid timestamp = expired
+        if not self.fetched_at_epoch:
+            self.fetched_at_epoch = _parse_epoch(self.fetched_at)
+        return _is_expired(self.status, self.fetched_at_epoch)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        Built explicitly rather than via dataclasses.asdict(), which deep-copies
+        every field; values are only serialized, never mutated.
+        """
+        return {
+            "title": self.title,
+            "year": self.year,
+            "description": self.description,
+            "url": self.url,
+            "imdb_id": self.imdb_id,
+            "vpro_id": self.vpro_id,
+            "media_type": self.media_type,
+            "status": self.status,
+            "fetched_at": self.fetched_at,
+            "last_accessed": self.last_accessed,
+            "lookup_method": self.lookup_method,
+            "discovered_imdb": self.discovered_imdb,
+            "content_rating": self.content_rating,
+            "vpro_rating": self.vpro_rating,
+            "images": self.images,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CacheEntry":
@@ -146,9 +273,6 @@ class CacheEntry:
         Returns:
             CacheEntry ready for caching
         """
-        # Import here to avoid circular import at module level
-        from text_utils import sanitize_description
-
         # Determine effective values
         effective_imdb = film.imdb_id or film.discovered_imdb
         effective_status = status or (
@@ -224,10 +348,11 @@ class FileCache:
 
     Features:
     - Atomic writes via temp file + rename
-    - Optional file locking (Unix) for concurrent access
+    - Per-writer temp files, so concurrent writers never share one
     - Directory sharding to avoid too many files in one directory
     - LRU eviction when entry count or size limit exceeded
     - TTL enforcement on read
+    - In-memory LRU of recently used entries, so hot keys skip disk and JSON
 
     Usage:
         cache = FileCache("./cache")
@@ -250,69 +375,232 @@ class FileCache:
             cache_dir or os.environ.get("CACHE_DIR", "./cache")
         )
         self._cache_dir.mkdir(parents=True, exist_ok=True)
+        # A single lock guards all in-memory bookkeeping below. It is only held
+        # for dict updates, never across file I/O, so critical sections stay
+        # short; striping it would split the global LRU order and the shared
+        # size/prefix indexes across locks.
         self._lock = threading.Lock()
-        self._access_times: Dict[str, float] = {}
-
-        # Load existing access times on startup
-        self._load_access_times()
-
-    def _get_cache_path(self, key: str) -> Path:
+        # Path -> last access time, ordered least- to most-recently used
+        self._access_times: "OrderedDict[str, float]" = OrderedDict()
+        # (title_year_prefix, type_suffix) -> cache file paths, for 'none' IMDB fallback
+        self._prefix_index: Dict[Tuple[str, str], List[str]] = {}
+        # Per-file sizes and their running total, so eviction checks need no stat calls
+        self._entry_sizes: Dict[str, int] = {}
+        self._total_size = 0
+        # Path -> (status, fetched epoch) of known entries, so stats() needn't re-parse files
+        self._entry_meta: Dict[str, Tuple[str, float]] = {}
+        # Key -> (path, entry) for recently used keys, least- to most-recently used
+        self._hot: "OrderedDict[str, Tuple[str, CacheEntry]]" = OrderedDict()
+        # Path -> sequence number of its last write, so a read that parsed
+        # older bytes can tell it must not populate _hot
+        self._write_generations: Dict[str, int] = {}
+        self._write_seq = 0
+        # Paths read since their file mtime was last synced (see flush())
+        self._dirty_mtimes: Set[str] = set()
+        # Shard directories known to exist (skips mkdir syscalls on hot paths)
+        self._created_shards: Set[str] = set()
+
+        # Load existing access times in the background so startup does not
+        # wait on a full directory scan. read()/write() work meanwhile;
+        # stats() waits for the scan and eviction is skipped until it's done.
+        self._loaded = threading.Event()
+        threading.Thread(
+            target=self._load_access_times,
+            name="cache-loader",
+            daemon=True,
+        ).start()
+
+    def _get_cache_path(self, key: str, legacy_hash: bool = False) -> Path:
         """
         Get cache file path for a key.
 
         Uses hash-based directory sharding to avoid filesystem issues
-        with too many files in one directory.
+        with too many files in one directory. The hash only serves sharding
+        and filename uniqueness, so a short BLAKE2b digest is used instead
+        of SHA-256.
 
         Args:
             key: Cache key
+            legacy_hash: Use the original SHA-256 layout (for reading old entries)
 
         Returns:
             Path to cache file
         """
-        # Hash the key for sharding and filename safety
-        key_hash = hashlib.sha256(key.encode()).hexdigest()
-
-        # Use first 2 chars of hash for shard directory
-        shard_dir = self._cache_dir / key_hash[:2]
-        shard_dir.mkdir(exist_ok=True)
+        shard, filename = _shard_and_filename(key, legacy_hash)
+        shard_dir = self._cache_dir / shard
+        if shard not in self._created_shards:
+            shard_dir.mkdir(exist_ok=True)
+            self._created_shards.add(shard)  # set.add is atomic under the GIL
 
-        # Sanitize key for filename (keep it readable)
-        safe_key = "".join(
-            c if c.isalnum() or c in '-_' else '_'
-            for c in key
-        )[:80]
-
-        return shard_dir / f"{safe_key}_{key_hash[:12]}.json"
+        return shard_dir / filename
 
     def _load_access_times(self) -> None:
-        """Load access times from existing cache files for LRU tracking."""
+        """
+        Load access times and shard/prefix indexes from existing cache files.
+
+        Runs on a background thread started by __init__. The scan collects
+        into local structures and merges them under the lock at the end;
+        files written or read in the meantime keep their newer tracking.
+        """
+        loaded: Dict[str, Tuple[float, int]] = {}
+        shards: Set[str] = set()
         try:
-            for item in self._cache_dir.iterdir():
-                if item.is_dir() and len(item.name) == 2:
-                    for cache_file in item.glob("*.json"):
-                        try:
-                            stat = cache_file.stat()
-                            self._access_times[str(cache_file)] = stat.st_mtime
-                        except OSError:
-                            pass
+            shard_dirs = self._list_shard_dirs()
+            shards.update(d.name for d in shard_dirs)
+            # stat() releases the GIL, so shards are scanned concurrently
+            with ThreadPoolExecutor(
+                max_workers=min(CACHE_SCAN_WORKERS, len(shard_dirs) or 1),
+                thread_name_prefix="cache-scan",
+            ) as executor:
+                for shard_files in executor.map(
+                    self._scan_shard, [d.path for d in shard_dirs]
+                ):
+                    loaded.update(shard_files)
         except OSError as e:
             logger.warning(f"Failed to load cache access times: {e}")
 
-    def _lock_file(self, file_handle, exclusive: bool = False) -> None:
+        try:
+            with self._lock:
+                self._created_shards.update(shards)
+                # Seed LRU order from file mtimes: walk newest to oldest and
+                # push each to the front, ahead of anything tracked meanwhile.
+                for path_str, (mtime, size) in sorted(
+                    loaded.items(), key=lambda x: x[1][0], reverse=True
+                ):
+                    if path_str not in self._access_times:
+                        self._access_times[path_str] = mtime
+                        self._access_times.move_to_end(path_str, last=False)
+                    # A read during the scan only tracks the access time;
+                    # size and prefix index still need recording here
+                    if path_str not in self._entry_sizes:
+                        self._entry_sizes[path_str] = size
+                        self._total_size += size
+                        self._index_path(path_str)
+        finally:
+            self._loaded.set()
+
+    def _list_shard_dirs(self) -> List[os.DirEntry]:
+        """
+        List the shard directories in the cache root.
+
+        Uses os.scandir so directory checks come from the readdir result
+        instead of a stat per entry.
+
+        Returns:
+            DirEntry for each 2-char shard directory
+        """
+        with os.scandir(self._cache_dir) as root:
+            return [
+                item for item in root
+                if len(item.name) == 2 and item.is_dir(follow_symlinks=False)
+            ]
+
+    @staticmethod
+    def _scan_shard(shard_path: str) -> Dict[str, Tuple[float, int]]:
         """
-        Apply file lock if available.
+        Stat all cache files in one shard directory.
 
         Args:
-            file_handle: Open file handle
-            exclusive: True for write lock, False for read lock
+            shard_path: Path to the shard directory
+
+        Returns:
+            Dict of path -> (mtime, size); unreadable files are skipped
         """
-        if HAS_FCNTL:
-            try:
-                lock_type = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
-                fcntl.flock(file_handle.fileno(), lock_type | fcntl.LOCK_NB)
-            except (IOError, OSError):
-                # Lock not available, proceed anyway
-                pass
+        found: Dict[str, Tuple[float, int]] = {}
+        try:
+            with os.scandir(shard_path) as shard:
+                for cache_file in shard:
+                    if not cache_file.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = cache_file.stat()
+                        found[cache_file.path] = (stat.st_mtime, stat.st_size)
+                    except OSError:
+                        pass
+        except OSError as e:
+            logger.warning(f"Failed to scan cache shard {shard_path}: {e}")
+        return found
+
+    def _iter_shard_files(self) -> Iterator[os.DirEntry]:
+        """
+        Yield the .json files in all shard directories.
+
+        No Path is built per file.
+
+        Yields:
+            DirEntry for each cache file
+        """
+        for shard_dir in self._list_shard_dirs():
+            with os.scandir(shard_dir.path) as shard:
+                for cache_file in shard:
+                    if cache_file.name.endswith(".json"):
+                        yield cache_file
+
+    def _prefix_index_key(self, path_str: str) -> Optional[Tuple[str, str]]:
+        """
+        Derive the prefix index key for a cache file path.
+
+        Only files whose key carries an explicit type suffix are indexed,
+        matching the '-{type}_' filename check of the title+year fallback.
+
+        Args:
+            path_str: Path to cache file
+
+        Returns:
+            Tuple of (title_year_prefix, type_suffix), or None if not indexable
+        """
+        stem = os.path.splitext(os.path.basename(path_str))[0]
+        if '_' not in stem:
+            return None
+        match = _KEY_PATTERN.match(stem.rsplit('_', 1)[0])
+        if not match or not match.group("type"):
+            return None
+        return match.group("prefix"), match.group("type")
+
+    def _index_path(self, path_str: str) -> None:
+        """
+        Add a cache file to the prefix index.
+
+        Caller must hold self._lock.
+        """
+        index_key = self._prefix_index_key(path_str)
+        if index_key is None:
+            return
+        paths = self._prefix_index.setdefault(index_key, [])
+        if path_str not in paths:
+            paths.append(path_str)
+
+    def _unindex_path(self, path_str: str) -> None:
+        """
+        Remove a cache file from the prefix index.
+
+        Caller must hold self._lock.
+        """
+        index_key = self._prefix_index_key(path_str)
+        if index_key is None:
+            return
+        paths = self._prefix_index.get(index_key)
+        if not paths:
+            return
+        try:
+            paths.remove(path_str)
+        except ValueError:
+            pass
+        if not paths:
+            del self._prefix_index[index_key]
+
+    def _forget_path(self, path_str: str) -> None:
+        """
+        Drop a cache file from all in-memory tracking.
+
+        Caller must hold self._lock.
+        """
+        self._access_times.pop(path_str, None)
+        self._total_size -= self._entry_sizes.pop(path_str, 0)
+        self._entry_meta.pop(path_str, None)
+        self._dirty_mtimes.discard(path_str)
+        self._write_generations.pop(path_str, None)
+        self._unindex_path(path_str)
 
     def _extract_key_components(self, key: str) -> tuple:
         """
@@ -324,28 +612,14 @@ class FileCache:
         Returns:
             Tuple of (title_year_prefix, type_suffix) or (None, None) if invalid
         """
-        parts = key.rsplit("-", 2)
-        if len(parts) < 2:
+        match = _KEY_PATTERN.match(key)
+        if not match:
             return None, None
 
-        if parts[-1] in ("m", "s"):
-            return parts[0], parts[-1]
+        # No type suffix (legacy keys) defaults to movie
+        return match.group("prefix"), match.group("type") or "m"
 
-        # No type suffix - extract prefix before 'none'
-        if "-none" in key:
-            return key.rsplit("-none", 1)[0], "m"
-
-        return None, None
-
-    def _has_type_suffix(self, key: str) -> bool:
-        """Check if key has media type suffix (-m or -s)."""
-        return key.endswith("-m") or key.endswith("-s")
-
-    def _has_none_imdb(self, key: str) -> bool:
-        """Check if key has 'none' as IMDB placeholder."""
-        return "-none-" in key or key.endswith("-none")
-
-    def _find_by_title_year(self, key: str) -> Path:
+    def _find_by_title_year(self, key: str) -> Optional[Path]:
         """
         Find cache entry by title+year when IMDB is 'none'.
 
@@ -357,73 +631,64 @@ class FileCache:
             key: Cache key like 'vpro-die-hard-1988-none-m'
 
         Returns:
-            Path to matching cache file, or non-existent Path if not found
+            Path to matching cache file, or None if not found
         """
         title_year_prefix, type_suffix = self._extract_key_components(key)
         if not title_year_prefix:
             logger.debug(f"Cache fallback: key '{key}' has insufficient parts")
-            return Path("/nonexistent")
+            return None
 
         logger.debug(f"Cache fallback search: prefix='{title_year_prefix}', type='{type_suffix}'")
 
-        # Search all shards for matching files.
-        # Iterate shard directories explicitly rather than using glob("**/*.json")
-        # to avoid a full recursive walk that would stat every cached file.
-        try:
-            for shard in self._cache_dir.iterdir():
-                if not shard.is_dir() or len(shard.name) != 2:
-                    continue
-                for cache_file in shard.glob("*.json"):
-                    filename = cache_file.stem
-                    if filename.startswith(title_year_prefix) and f"-{type_suffix}_" in filename:
-                        logger.info(f"Cache fallback HIT: {key} -> {filename}")
-                        return cache_file
-        except OSError as e:
-            logger.warning(f"Cache fallback error: {e}")
+        # O(1) lookup in the prefix index (maintained on load/write/delete)
+        # instead of walking every shard directory per request.
+        with self._lock:
+            paths = self._prefix_index.get((title_year_prefix, type_suffix))
+            match = paths[0] if paths else None
 
-        return Path("/nonexistent")
+        if match:
+            logger.info(f"Cache fallback HIT: {key} -> {Path(match).stem}")
+            return Path(match)
 
-    def _unlock_file(self, file_handle) -> None:
-        """Release file lock if available."""
-        if HAS_FCNTL:
-            try:
-                fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
-            except (IOError, OSError):
-                pass
+        return None
 
-    def _resolve_cache_path(self, key: str) -> Optional[Path]:
+    def _candidate_paths(self, key: str) -> Iterator[Path]:
         """
-        Resolve cache path with backward compatibility fallbacks.
+        Yield possible cache file paths for a key, most specific first.
 
-        Tries multiple strategies:
+        Tries multiple strategies, with backward compatibility fallbacks:
         1. Exact key match
         2. Key with default type suffix (-m) for old keys
         3. Title+year search for keys with 'none' IMDB
 
+        Strategies 1 and 2 also yield the legacy SHA-256 file layout, so
+        entries written before the hash change remain readable until they
+        expire or are evicted. Paths are not checked for existence; the
+        caller opens them and moves on when a file is missing.
+
         Args:
             key: Cache key to resolve
 
-        Returns:
-            Path to cache file if found, None otherwise
+        Yields:
+            Candidate cache file paths
         """
         # Strategy 1: Exact key
-        path = self._get_cache_path(key)
-        if path.exists():
-            return path
+        candidates = [key]
 
         # Strategy 2: Add default type suffix if missing
-        if not self._has_type_suffix(key):
-            path = self._get_cache_path(key + "-m")
-            if path.exists():
-                return path
+        if not key.endswith(_TYPE_SUFFIXES):
+            candidates.append(key + "-m")
+
+        for candidate in candidates:
+            for legacy_hash in (False, True):
+                yield self._get_cache_path(candidate, legacy_hash=legacy_hash)
 
         # Strategy 3: Search by title+year for 'none' IMDB keys
-        if self._has_none_imdb(key):
+        match = _KEY_PATTERN.match(key)
+        if match and match.group("imdb") == "none":
             path = self._find_by_title_year(key)
-            if path.exists():
-                return path
-
-        return None
+            if path:
+                yield path
 
     def read(self, key: str) -> Optional[CacheEntry]:
         """
@@ -440,18 +705,36 @@ class FileCache:
         Returns:
             CacheEntry if found and valid, None otherwise
         """
-        cache_path = self._resolve_cache_path(key)
-        if not cache_path:
+        hot_entry = self._read_hot(key)
+        if hot_entry is not None:
+            return hot_entry
+
+        # Open candidates directly instead of checking exists() first: a
+        # missing file costs one failed open rather than stat + open.
+        # No shared lock is needed: writers replace files atomically via
+        # rename, so a reader always sees either the old or the new file.
+        cache_path = None
+        raw = None
+        generation = 0
+        for candidate in self._candidate_paths(key):
+            # Taken before reading: if write() replaces the file after this,
+            # the entry parsed below is stale and must not go into _hot
+            generation = self._write_generations.get(str(candidate), 0)
+            try:
+                raw = candidate.read_bytes()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.warning(f"Cache read error for {key}: {e}")
+                return None
+            cache_path = candidate
+            break
+
+        if cache_path is None:
             return None
 
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                self._lock_file(f, exclusive=False)
-                try:
-                    data = json.load(f)
-                finally:
-                    self._unlock_file(f)
-
+            data = _json_loads(raw)
             entry = CacheEntry.from_dict(data)
 
             # Check expiration
@@ -461,17 +744,15 @@ class FileCache:
                 return None
 
             # Update access time for LRU
-            self._touch(cache_path)
+            self._touch(cache_path, entry)
+            self._remember_hot(key, str(cache_path), entry, generation=generation)
 
-            return entry
+            return copy.copy(entry)
 
-        except (json.JSONDecodeError, TypeError, KeyError) as e:
+        except (ValueError, TypeError, KeyError) as e:
             logger.warning(f"Invalid cache entry {key}: {e}")
             self._delete_file(cache_path)
             return None
-        except OSError as e:
-            logger.warning(f"Cache read error for {key}: {e}")
-            return None
 
     def write(self, key: str, entry: CacheEntry) -> bool:
         """
@@ -490,59 +771,181 @@ class FileCache:
         self._maybe_evict()
 
         cache_path = self._get_cache_path(key)
-        temp_path = cache_path.with_suffix('.tmp')
+        temp_path = None
 
         try:
             # Set timestamps
-            now = datetime.now(timezone.utc).isoformat()
+            now_epoch = time.time()
+            now = datetime.fromtimestamp(now_epoch, timezone.utc).isoformat()
             entry.last_accessed = now
             if not entry.fetched_at:
                 entry.fetched_at = now
+                entry.fetched_at_epoch = now_epoch
+            elif not entry.fetched_at_epoch:
+                entry.fetched_at_epoch = _parse_epoch(entry.fetched_at)
 
-            # Write to temp file first
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                self._lock_file(f, exclusive=True)
-                try:
-                    json.dump(entry.to_dict(), f, ensure_ascii=False, indent=2)
-                finally:
-                    self._unlock_file(f)
+            payload = _json_dumps(entry.to_dict())
+
+            # Write to a uniquely named temp file in the same directory:
+            # concurrent writers of the same key each rename a complete
+            # file, and the last rename wins.
+            fd, temp_path = tempfile.mkstemp(
+                prefix=".", suffix=".tmp", dir=cache_path.parent
+            )
+            os.fchmod(fd, _CACHE_FILE_MODE)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                if CACHE_FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
 
             # Atomic rename
-            temp_path.replace(cache_path)
+            os.replace(temp_path, cache_path)
+            temp_path = None
+            size = len(payload)
 
-            # Update access time tracking
+            # Update access time and size tracking
+            path_str = str(cache_path)
             with self._lock:
-                self._access_times[str(cache_path)] = time.time()
+                self._access_times[path_str] = time.time()
+                self._access_times.move_to_end(path_str)
+                self._total_size += size - self._entry_sizes.get(path_str, 0)
+                self._entry_sizes[path_str] = size
+                self._entry_meta[path_str] = (entry.status, entry.fetched_at_epoch)
+                self._index_path(path_str)
+                self._write_seq += 1
+                self._write_generations[path_str] = self._write_seq
+            self._remember_hot(key, path_str, copy.copy(entry), replaced=True)
 
             return True
 
         except Exception as e:
             logger.warning(f"Cache write error for {key}: {e}")
-            # Clean up temp file — broad catch ensures cleanup even if json.dump
-            # raises TypeError (non-serializable data) rather than OSError
+            # Clean up temp file — broad catch ensures cleanup on any failure
+            # after it was created, not just OSError
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            return False
+
+    def _read_hot(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up a key in the in-memory LRU.
+
+        A hit is only valid while its file is still tracked (not deleted or
+        evicted) and the entry has not expired. Hits refresh the access time
+        like a disk read does.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached entry, or None on miss
+        """
+        with self._lock:
+            item = self._hot.get(key)
+            if item is None:
+                return None
+            path_str, entry = item
+            if path_str not in self._access_times or entry.is_expired():
+                del self._hot[key]
+                return None
+            self._hot.move_to_end(key)
+            self._access_times[path_str] = time.time()
+            self._access_times.move_to_end(path_str)
+            self._dirty_mtimes.add(path_str)
+            flush_due = len(self._dirty_mtimes) >= MTIME_FLUSH_THRESHOLD
+        if flush_due:
+            self.flush()
+        return copy.copy(entry)
+
+    def _remember_hot(
+        self,
+        key: str,
+        path_str: str,
+        entry: CacheEntry,
+        replaced: bool = False,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store a parsed entry in the in-memory LRU.
+
+        Args:
+            key: Cache key
+            path_str: Path of the file backing the entry
+            entry: Entry to keep (must not be shared with callers)
+            replaced: File contents changed; drop other keys resolved to it
+            generation: Write generation of the file when it was read; the
+                entry is skipped if the file has been rewritten since
+        """
+        with self._lock:
+            if (generation is not None
+                    and self._write_generations.get(path_str, 0) != generation):
+                return
+            if replaced:
+                stale = [k for k, (p, _) in self._hot.items() if p == path_str]
+                for stale_key in stale:
+                    del self._hot[stale_key]
+            self._hot[key] = (path_str, entry)
+            self._hot.move_to_end(key)
+            while len(self._hot) > MEMORY_CACHE_ENTRIES:
+                self._hot.popitem(last=False)
+
+    def _touch(self, cache_path: Path, entry: Optional[CacheEntry] = None) -> None:
+        """
+        Update access time for LRU tracking (and entry metadata, if given).
+
+        Only the in-memory LRU is updated here. File mtimes, which seed the
+        LRU order on the next startup, are synced in batches by flush().
+        """
+        path_str = str(cache_path)
+        with self._lock:
+            self._access_times[path_str] = time.time()
+            self._access_times.move_to_end(path_str)
+            if entry is not None:
+                self._entry_meta[path_str] = (entry.status, entry.fetched_at_epoch)
+            self._dirty_mtimes.add(path_str)
+            flush_due = len(self._dirty_mtimes) >= MTIME_FLUSH_THRESHOLD
+        if flush_due:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Sync file mtimes of recently read entries to their access times.
+
+        Called automatically every MTIME_FLUSH_THRESHOLD reads; call it on
+        shutdown too so the next startup sees an up-to-date LRU order.
+        A crash only loses ordering precision, never entries.
+        """
+        with self._lock:
+            dirty = self._dirty_mtimes
+            self._dirty_mtimes = set()
+
+        for path_str in dirty:
             try:
-                temp_path.unlink(missing_ok=True)
+                os.utime(path_str)
             except OSError:
                 pass
-            return False
 
-    def _touch(self, cache_path: Path) -> None:
-        """Update access time for LRU tracking."""
-        try:
-            cache_path.touch()
-            with self._lock:
-                self._access_times[str(cache_path)] = time.time()
-        except OSError:
-            pass
+    def _delete_file(self, cache_path: Union[str, Path]) -> bool:
+        """
+        Delete a cache file and remove from tracking.
 
-    def _delete_file(self, cache_path: Path) -> None:
-        """Delete a cache file and remove from tracking."""
+        Returns:
+            True if a file was removed (False if it was already gone)
+        """
         try:
-            cache_path.unlink(missing_ok=True)
-            with self._lock:
-                self._access_times.pop(str(cache_path), None)
+            os.unlink(cache_path)
+            removed = True
+        except FileNotFoundError:
+            removed = False
         except OSError:
-            pass
+            return False
+        with self._lock:
+            self._forget_path(str(cache_path))
+        return removed
 
     def _maybe_evict(self) -> None:
         """
@@ -550,37 +953,33 @@ class FileCache:
 
         Triggered before writes to ensure space is available.
         """
-        with self._lock:
-            entry_count = len(self._access_times)
-            access_snapshot = dict(self._access_times)
-
-        # Size check done outside the lock to avoid holding it during I/O.
-        if entry_count < MAX_CACHE_ENTRIES:
-            try:
-                total_size = sum(
-                    Path(p).stat().st_size
-                    for p in access_snapshot.keys()
-                    if Path(p).exists()
-                )
-                if total_size < MAX_CACHE_SIZE_MB * 1024 * 1024:
-                    return
-            except OSError:
-                return
+        # Counts are incomplete until the startup scan finishes; eviction
+        # catches up on the first write after that.
+        if not self._loaded.is_set():
+            return
 
-        # Determine which entries to evict (oldest 10% by access time).
-        sorted_by_access = sorted(access_snapshot.items(), key=lambda x: x[1])
-        to_evict = sorted_by_access[:max(1, len(sorted_by_access) // 10)]
-
-        # Remove from tracking inside lock, then delete files outside.
-        # Calling _delete_file() while holding self._lock deadlocks because
-        # _delete_file() also acquires self._lock (threading.Lock is not reentrant).
+        to_evict: List[str] = []
         with self._lock:
-            for path_str, _ in to_evict:
-                self._access_times.pop(path_str, None)
+            # Entry count and total size are tracked in memory, so the common
+            # no-eviction path needs no filesystem access.
+            if (len(self._access_times) < MAX_CACHE_ENTRIES
+                    and self._total_size < MAX_CACHE_SIZE_MB * 1024 * 1024):
+                return
 
-        for path_str, _ in to_evict:
+            # Evict the oldest 10% straight off the front of the LRU-ordered
+            # dict. Remove from tracking inside lock, then delete files outside.
+            # Calling _delete_file() while holding self._lock deadlocks because
+            # _delete_file() also acquires self._lock (threading.Lock is not reentrant).
+            evict_count = max(1, len(self._access_times) // 10)
+            while self._access_times and len(to_evict) < evict_count:
+                path_str, _ = self._access_times.popitem(last=False)
+                self._forget_path(path_str)
+                to_evict.append(path_str)
+
+        # Plain os.unlink on the tracked path strings: no Path object per file
+        for path_str in to_evict:
             try:
-                Path(path_str).unlink(missing_ok=True)
+                os.unlink(path_str)
             except OSError:
                 pass
 
@@ -597,11 +996,16 @@ class FileCache:
         Returns:
             True if entry was deleted
         """
-        cache_path = self._get_cache_path(key)
-        if cache_path.exists():
-            self._delete_file(cache_path)
-            return True
-        return False
+        with self._lock:
+            self._hot.pop(key, None)
+
+        # Unlink directly (one syscall) rather than exists() + unlink
+        deleted = False
+        for legacy_hash in (False, True):
+            cache_path = self._get_cache_path(key, legacy_hash=legacy_hash)
+            if self._delete_file(cache_path):
+                deleted = True
+        return deleted
 
     def clear(self, preserve_credentials: bool = True) -> int:
         """
@@ -614,19 +1018,28 @@ class FileCache:
             Number of files deleted
         """
         count = 0
+        with self._lock:
+            self._hot.clear()
         try:
-            # Clear sharded directories
-            for item in self._cache_dir.iterdir():
-                if item.is_dir() and len(item.name) == 2:
-                    for cache_file in item.glob("*.json"):
-                        self._delete_file(cache_file)
-                        count += 1
-
-            # Clear root level json files (except credentials)
-            for cache_file in self._cache_dir.glob("*.json"):
-                if preserve_credentials and "credentials" in cache_file.name:
-                    continue
-                self._delete_file(cache_file)
+            # Single pass over the cache root: sharded directories and
+            # root level json files (except credentials)
+            to_delete: List[str] = []
+            with os.scandir(self._cache_dir) as root:
+                for item in root:
+                    if item.is_dir(follow_symlinks=False):
+                        if len(item.name) != 2:
+                            continue
+                        with os.scandir(item.path) as shard:
+                            to_delete.extend(
+                                f.path for f in shard if f.name.endswith(".json")
+                            )
+                    elif item.name.endswith(".json"):
+                        if preserve_credentials and "credentials" in item.name:
+                            continue
+                        to_delete.append(item.path)
+
+            for path_str in to_delete:
+                self._delete_file(path_str)
                 count += 1
 
         except OSError as e:
@@ -641,34 +1054,48 @@ class FileCache:
         Returns:
             Dict with cache stats
         """
-        # Take a snapshot under the lock, then do all I/O outside it.
-        # Holding the lock while stat-ing and JSON-parsing thousands of files
-        # would block every write() call for potentially several seconds.
+        self._loaded.wait()
+
+        # Counts come from in-memory entry metadata recorded on write/read.
+        # Only entries loaded at startup and not touched since are parsed,
+        # once, outside the lock so write() calls are never blocked on I/O.
         with self._lock:
-            paths_snapshot = list(self._access_times.keys())
             total_entries = len(self._access_times)
+            total_size = self._total_size
+            unknown_paths = [
+                p for p in self._access_times if p not in self._entry_meta
+            ]
+
+        loaded_meta: Dict[str, Tuple[str, float]] = {}
+        for path_str in unknown_paths:
+            try:
+                with open(path_str, 'rb') as f:
+                    data = _json_loads(f.read())
+            except (OSError, ValueError):
+                continue
+            loaded_meta[path_str] = (
+                data.get("status", CacheStatus.NOT_FOUND.value),
+                _parse_epoch(data.get("fetched_at", "")),
+            )
+
+        # Merge parsed metadata and snapshot it in one lock acquisition
+        with self._lock:
+            for path_str, meta in loaded_meta.items():
+                if path_str in self._access_times:
+                    self._entry_meta.setdefault(path_str, meta)
+            meta_snapshot = list(self._entry_meta.values())
 
-        total_size = 0
         found_count = 0
         not_found_count = 0
         expired_count = 0
 
-        for path_str in paths_snapshot:
-            path = Path(path_str)
-            if path.exists():
-                try:
-                    total_size += path.stat().st_size
-                    data = json.loads(path.read_text())
-                    entry = CacheEntry.from_dict(data)
-
-                    if entry.is_expired():
-                        expired_count += 1
-                    elif entry.status == CacheStatus.FOUND.value:
-                        found_count += 1
-                    else:
-                        not_found_count += 1
-                except (OSError, json.JSONDecodeError):
-                    pass
+        for status, fetched_epoch in meta_snapshot:
+            if _is_expired(status, fetched_epoch):
+                expired_count += 1
+            elif status == CacheStatus.FOUND.value:
+                found_count += 1
+            else:
+                not_found_count += 1
 
         return {
             "total_entries": total_entries,
@@ -691,14 +1118,12 @@ class FileCache:
         """
         keys = []
         try:
-            for item in self._cache_dir.iterdir():
-                if item.is_dir() and len(item.name) == 2:
-                    for cache_file in item.glob("*.json"):
-                        # Extract key from filename (before hash suffix)
-                        name = cache_file.stem
-                        if '_' in name:
-                            key_part = name.rsplit('_', 1)[0]
-                            keys.append(key_part)
+            for cache_file in self._iter_shard_files():
+                # Extract key from filename (before hash suffix)
+                name = cache_file.name[:-len(".json")]
+                if '_' in name:
+                    key_part = name.rsplit('_', 1)[0]
+                    keys.append(key_part)
         except OSError:
             pass
         return keys
@@ -76,6 +76,14 @@ DEFAULT_CACHE_TTL_FOUND: Final = 30 * 24 * 60 * 60  # 30 days for found entries
 DEFAULT_CACHE_TTL_NOT_FOUND: Final = 1 * 60 * 60  # 1 hour for not-found entries (reduced from 7 days)
 MAX_CACHE_SIZE_MB: Final = 500  # Maximum cache size in MB
 MAX_CACHE_ENTRIES: Final = 10000  # Maximum number of cached items
+MEMORY_CACHE_ENTRIES: Final = 1024  # Parsed entries kept in memory in front of the disk cache
+MTIME_FLUSH_THRESHOLD: Final = 256  # Cache reads between syncing LRU access times to file mtimes
+CACHE_SCAN_WORKERS: Final = 8  # Threads used to stat cache shards at startup
+TMDB_TITLES_CACHE_TTL: Final = 24 * 60 * 60  # 1 day for TMDB alternate title lists
+TMDB_TITLES_CACHE_ENTRIES: Final = 2048  # TMDB title lists kept in memory
+POMS_CACHE_TTL: Final = 60  # Seconds POMS searches / parsed items are reused (auto-match then Fix Match)
+POMS_SEARCH_CACHE_ENTRIES: Final = 256  # POMS search result lists kept in memory
+POMS_PARSE_CACHE_ENTRIES: Final = 128  # Parsed (and scraped) POMS items kept in memory
 
 
 # =============================================================================
@@ -87,6 +95,7 @@ RATE_LIMIT_TMDB: Final = 4.0  # TMDB allows 40/10s
 RATE_LIMIT_WEB_SEARCH: Final = 0.5  # Be nice to search engines
 RATE_LIMIT_VPRO: Final = 2.0  # Be nice to vprogids.nl
 RATE_LIMIT_CINEMA: Final = 2.0  # Be nice to cinema.nl
+MAX_RATE_LIMITERS: Final = 256  # Cap on per-host limiters kept in memory
 
 
 # =============================================================================
@@ -95,7 +104,11 @@ RATE_LIMIT_CINEMA: Final = 2.0  # Be nice to cinema.nl
 
 MAX_RETRIES: Final = 3
 RETRY_BACKOFF_BASE: Final = 2.0  # Exponential backoff base (seconds)
+MAX_RETRY_AFTER: Final = 300.0  # Cap on server-requested Retry-After pauses (seconds)
 CREDENTIAL_REFRESH_COOLDOWN: Final = 60.0  # Minimum seconds between refresh attempts
+CREDENTIAL_FETCH_WORKERS: Final = 4  # Concurrent linked-script fetches during refresh
+TMDB_FETCH_WORKERS: Final = 4  # Concurrent TMDB requests per lookup (details, titles, ids)
+SCRAPE_WORKERS: Final = 8  # Concurrent cinema.nl page scrapes per search (still rate limited)
 
 
 # =============================================================================
@@ -154,3 +167,8 @@ VPRO_RETURN_IMAGES: bool = _get_bool_env("VPRO_RETURN_IMAGES", False)
 # setting, not the provider. Custom ratingImage schemes are not supported.
 # See: https://forums.plex.tv/c/dev-api-corner/ for updates on this limitation.
 VPRO_RETURN_RATING: bool = _get_bool_env("VPRO_RETURN_RATING", False)
+
+# fsync cache files before the atomic rename (default: false)
+# Cache entries can always be re-fetched, so durability across power loss
+# is traded for write latency by default.
+CACHE_FSYNC: bool = _get_bool_env("CACHE_FSYNC", False)
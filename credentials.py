@@ -16,13 +16,15 @@ mechanism is retained for potential future use.
 import json
 import logging
 import os
+import random
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
@@ -32,10 +34,28 @@ from constants import (
     DEFAULT_POMS_API_KEY,
     DEFAULT_POMS_API_SECRET,
     CREDENTIAL_REFRESH_COOLDOWN,
+    CREDENTIAL_FETCH_WORKERS,
 )
+from http_client import RateLimitedSession, create_session
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for fast (de)serialization, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    logger.debug("orjson not available, using stdlib json")
+
+# Try to import selectolax for fast script-tag extraction, fall back to bs4
+try:
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+    logger.debug("selectolax not available, using BeautifulSoup")
+
 
 @dataclass(frozen=True)
 class Credentials:
@@ -74,6 +94,17 @@ class CredentialManager:
          r'(?:apiSecret|secret)\s*[=:]\s*["\']([a-z0-9]{8,15})["\']'),
     ]
 
+    # All key/secret patterns folded into one alternation so the text is
+    # scanned once. Groups are named k<priority>/s<priority>; the captured
+    # value always sits in the group directly after the named one.
+    _COMBINED_RE = re.compile(
+        "|".join(
+            f"(?P<k{i}>{key_pattern})|(?P<s{i}>{secret_pattern})"
+            for i, (key_pattern, secret_pattern) in enumerate(CREDENTIAL_PATTERNS)
+        ),
+        re.IGNORECASE,
+    )
+
     _instance: Optional["CredentialManager"] = None
     _instance_lock = threading.Lock()
 
@@ -98,14 +129,26 @@ class CredentialManager:
         if getattr(self, '_initialized', False):
             return
 
-        self._lock = threading.RLock()  # Reentrant for nested calls
+        # _credentials is only ever replaced wholesale with a new (frozen)
+        # Credentials object, never mutated, so readers take a plain
+        # attribute load without locking. Writers serialize on _write_lock.
+        self._write_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()  # Guards refresh bookkeeping
         self._credentials: Optional[Credentials] = None
+        # (api_key, api_secret, source) last written to / read from disk
+        self._persisted: Optional[Tuple[str, str, str]] = None
         self._cache_file = Path(
             cache_file or
             os.environ.get("POMS_CACHE_FILE", "./cache/credentials.json")
         )
         self._refresh_in_progress = False
         self._last_refresh_attempt = 0.0
+        # Outcome of the last finished refresh, reported for the rest of
+        # its cooldown window (None while unknown)
+        self._last_refresh_success: Optional[bool] = None
+        # ((api_key, api_secret), until) for credentials the API rejected;
+        # replaced wholesale, read without locking
+        self._rejected: Optional[Tuple[Tuple[str, str], float]] = None
 
         self._load_cached()
         self._initialized = True
@@ -123,7 +166,8 @@ class CredentialManager:
             return False
 
         try:
-            data = json.loads(self._cache_file.read_text())
+            raw = self._cache_file.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
             fetched_at_str = data.get("fetched_at", "2000-01-01T00:00:00+00:00")
             try:
@@ -137,6 +181,7 @@ class CredentialManager:
                 fetched_at=fetched_at,
                 source=data.get("source", "cache")
             )
+            self._persisted = self._identity(self._credentials)
             logger.debug(f"Loaded cached credentials from {self._cache_file}")
             return True
 
@@ -144,26 +189,48 @@ class CredentialManager:
             logger.warning(f"Failed to load cached credentials: {e}")
             return False
 
+    @staticmethod
+    def _identity(creds: Credentials) -> Tuple[str, str, str]:
+        """Fields that decide whether the cache file needs rewriting."""
+        return (creds.api_key, creds.api_secret, creds.source)
+
     def _save_cache(self, creds: Credentials) -> None:
         """
         Save credentials to cache file atomically.
 
-        Uses temp file + rename pattern to prevent corruption.
+        Skipped if the file already holds the same key, secret and source
+        (the usual case: refreshes mostly return the same credentials).
+        Otherwise uses temp file + fsync + rename to prevent corruption.
         """
+        identity = self._identity(creds)
+        if identity == self._persisted and self._cache_file.exists():
+            logger.debug("Credentials unchanged, not rewriting cache")
+            return
+
         try:
             self._cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write to temp file first
-            temp_file = self._cache_file.with_suffix('.tmp')
-            temp_file.write_text(json.dumps({
+            data = {
                 "api_key": creds.api_key,
                 "api_secret": creds.api_secret,
                 "fetched_at": creds.fetched_at.isoformat(),
                 "source": creds.source,
-            }, indent=2))
+            }
+            if HAS_ORJSON:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2).encode('utf-8')
+
+            # Write to temp file first, flushed to disk before the rename
+            temp_file = self._cache_file.with_suffix('.tmp')
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
 
             # Atomic rename (on POSIX systems)
-            temp_file.replace(self._cache_file)
+            os.replace(temp_file, self._cache_file)
+            self._persisted = identity
             logger.debug(f"Saved credentials to {self._cache_file}")
 
         except OSError as e:
@@ -172,14 +239,14 @@ class CredentialManager:
     @property
     def api_key(self) -> str:
         """Get current API key, falling back to default."""
-        with self._lock:
-            return self._credentials.api_key if self._credentials else DEFAULT_POMS_API_KEY
+        creds = self._credentials
+        return creds.api_key if creds else DEFAULT_POMS_API_KEY
 
     @property
     def api_secret(self) -> str:
         """Get current API secret, falling back to default."""
-        with self._lock:
-            return self._credentials.api_secret if self._credentials else DEFAULT_POMS_API_SECRET
+        creds = self._credentials
+        return creds.api_secret if creds else DEFAULT_POMS_API_SECRET
 
     def get_credentials(self) -> Tuple[str, str]:
         """
@@ -188,52 +255,101 @@ class CredentialManager:
         Returns:
             Tuple of (api_key, api_secret)
         """
-        with self._lock:
-            if self._credentials:
-                return (self._credentials.api_key, self._credentials.api_secret)
-            return (DEFAULT_POMS_API_KEY, DEFAULT_POMS_API_SECRET)
+        creds = self._credentials
+        if creds:
+            return (creds.api_key, creds.api_secret)
+        return (DEFAULT_POMS_API_KEY, DEFAULT_POMS_API_SECRET)
+
+    def mark_rejected(self) -> None:
+        """
+        Record that the API rejected the current credentials (401/403).
+
+        The mark lasts one refresh cooldown, after which the credentials
+        are tried again.
+        """
+        self._rejected = (
+            self.get_credentials(),
+            time.monotonic() + CREDENTIAL_REFRESH_COOLDOWN,
+        )
+
+    def is_valid(self) -> bool:
+        """
+        Check whether the current credentials are worth sending.
+
+        Returns:
+            False if the key or secret is empty, or if the API rejected
+            these exact credentials within the last cooldown window
+        """
+        current = self.get_credentials()
+        if not all(current):
+            return False
+        rejected = self._rejected
+        return (
+            rejected is None
+            or rejected[0] != current
+            or time.monotonic() >= rejected[1]
+        )
 
     def invalidate_and_refresh(self) -> bool:
         """
         Invalidate current credentials and attempt to fetch fresh ones.
 
-        Thread-safe with cooldown to prevent hammering the source.
+        Thread-safe with cooldown to prevent hammering the source. Within
+        the cooldown window the outcome of the last refresh is returned,
+        so a failed refresh keeps reporting failure instead of sending
+        every caller back to retry with the same credentials. The thread
+        doing the refresh gets the same answer, and callers arriving while
+        it is still running get False.
 
         Returns:
             True if refresh succeeded and new credentials are available
         """
-        with self._lock:
+        with self._refresh_lock:
             now = time.monotonic()
 
             # Check cooldown
             if now - self._last_refresh_attempt < CREDENTIAL_REFRESH_COOLDOWN:
                 logger.debug("Credential refresh on cooldown, skipping")
+                if self._last_refresh_success is not None:
+                    return self._last_refresh_success
                 return self._credentials is not None
 
             # Check if another thread is already refreshing
             if self._refresh_in_progress:
                 logger.debug("Credential refresh already in progress")
-                return self._credentials is not None
+                return bool(self._last_refresh_success)
 
             self._refresh_in_progress = True
-            self._last_refresh_attempt = now
+            self._last_refresh_success = None
+            # Jitter the cooldown start so workers across processes don't
+            # all retry at the same moment
+            self._last_refresh_attempt = now + random.uniform(
+                0, CREDENTIAL_REFRESH_COOLDOWN * 0.1
+            )
 
         try:
             # Perform fetch outside the lock to avoid blocking other threads
             new_creds = self._fetch_fresh_credentials()
 
-            with self._lock:
-                if new_creds:
+            with self._refresh_lock:
+                self._last_refresh_success = new_creds is not None
+
+            if new_creds:
+                with self._write_lock:
                     self._credentials = new_creds
                     self._save_cache(new_creds)
-                    return True
-                return self._credentials is not None
+                return True
+            # Same answer cooldown callers get for this refresh
+            return self._last_refresh_success
 
         finally:
-            with self._lock:
+            with self._refresh_lock:
                 self._refresh_in_progress = False
 
-    def _fetch_fresh_credentials(self) -> Optional[Credentials]:
+    def _fetch_fresh_credentials(
+        self,
+        session: Optional[RateLimitedSession] = None,
+    ) -> Optional[Credentials]:
         """
         Attempt to fetch fresh credentials from vprogids.nl.
 
@@ -242,21 +358,21 @@ class CredentialManager:
         default credentials still work with the POMS API.
 
         Scrapes the search page and linked JavaScript files
-        for API credentials.
+        for API credentials. Requests go through the shared rate-limited
+        session, so they count against the vprogids.nl rate limit and
+        reuse its pooled connections.
+
+        Args:
+            session: Optional existing session to use
 
         Returns:
             New Credentials object or None if extraction failed
         """
         logger.info("Fetching fresh API credentials from vprogids.nl...")
 
-        try:
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                'Accept': 'text/html,application/xhtml+xml',
-                'Accept-Language': 'nl-NL,nl;q=0.9',
-            })
+        session = session or create_session(timeout=15)
 
+        try:
             response = session.get(VPRO_CREDENTIAL_URL, timeout=15)
             response.raise_for_status()
 
@@ -265,23 +381,17 @@ class CredentialManager:
 
             # Also check linked JavaScript files if not found
             if not (api_key and api_secret):
-                soup = BeautifulSoup(response.text, 'html.parser')
-                for script in soup.find_all('script', src=True):
-                    src = script['src']
+                srcs = []
+                for src in self._script_srcs(response.text):
                     if not src.startswith('http'):
                         base = "https://www.vprogids.nl"
                         src = f"{base}{src}" if src.startswith('/') else f"{base}/{src}"
+                    srcs.append(src)
 
-                    try:
-                        js_resp = session.get(src, timeout=10)
-                        if js_resp.ok:
-                            k, s = self._extract_credentials(js_resp.text)
-                            api_key = api_key or k
-                            api_secret = api_secret or s
-                            if api_key and api_secret:
-                                break
-                    except requests.RequestException:
-                        continue
+                if srcs:
+                    k, s = self._scan_scripts(session, srcs)
+                    api_key = api_key or k
+                    api_secret = api_secret or s
 
             if api_key and api_secret:
                 logger.info("Successfully extracted fresh credentials")
@@ -299,12 +409,39 @@ class CredentialManager:
             logger.error(f"Failed to fetch credentials: {e}")
             return None
 
-    def _extract_credentials(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+    @staticmethod
+    def _script_srcs(html: str) -> List[str]:
         """
-        Extract API credentials from page text using regex patterns.
+        Collect the src attributes of all <script src=...> tags.
 
         Args:
-            text: HTML or JavaScript text to search
+            html: Page HTML
+
+        Returns:
+            Script src values in document order
+        """
+        if HAS_SELECTOLAX:
+            return [
+                node.attributes['src']
+                for node in HTMLParser(html).css('script[src]')
+                if node.attributes.get('src')
+            ]
+        soup = BeautifulSoup(html, 'html.parser')
+        return [script['src'] for script in soup.find_all('script', src=True)]
+
+    def _scan_scripts(
+        self,
+        session: RateLimitedSession,
+        srcs: List[str],
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch linked JavaScript files concurrently and scan them for credentials.
+
+        Stops as soon as both values are found; pending fetches are cancelled.
+
+        Args:
+            session: Session to fetch the scripts with
+            srcs: Absolute script URLs
 
         Returns:
             Tuple of (api_key, api_secret), either may be None
@@ -312,26 +449,66 @@ class CredentialManager:
         api_key = None
         api_secret = None
 
-        for key_pattern, secret_pattern in self.CREDENTIAL_PATTERNS:
-            if not api_key:
-                match = re.search(key_pattern, text, re.IGNORECASE)
-                if match:
-                    api_key = match.group(1)
+        with ThreadPoolExecutor(max_workers=CREDENTIAL_FETCH_WORKERS) as executor:
+            futures = [executor.submit(session.get, src, timeout=10) for src in srcs]
+            for future in as_completed(futures):
+                try:
+                    js_resp = future.result()
+                except requests.RequestException:
+                    continue
+                if not js_resp.ok:
+                    continue
+
+                k, s = self._extract_credentials(js_resp.text)
+                api_key = api_key or k
+                api_secret = api_secret or s
+                if api_key and api_secret:
+                    for pending in futures:
+                        pending.cancel()
+                    break
 
-            if not api_secret:
-                match = re.search(secret_pattern, text, re.IGNORECASE)
-                if match:
-                    api_secret = match.group(1)
+        return api_key, api_secret
 
-            if api_key and api_secret:
+    def _extract_credentials(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extract API credentials from page text using regex patterns.
+
+        Args:
+            text: HTML or JavaScript text to search
+
+        Returns:
+            Tuple of (api_key, api_secret), either may be None
+        """
+        # Best match per slot as (priority, value); lower priority wins,
+        # matching the old pattern-by-pattern search order.
+        best_key: Optional[Tuple[int, str]] = None
+        best_secret: Optional[Tuple[int, str]] = None
+
+        for match in self._COMBINED_RE.finditer(text):
+            name = match.lastgroup
+            priority = int(name[1:])
+            value = match.group(match.lastindex + 1)
+
+            if name[0] == 'k':
+                if best_key is None or priority < best_key[0]:
+                    best_key = (priority, value)
+            elif best_secret is None or priority < best_secret[0]:
+                best_secret = (priority, value)
+
+            # Nothing can beat the most specific pattern
+            if best_key and best_secret and best_key[0] == 0 and best_secret[0] == 0:
                 break
 
+        api_key = best_key[1] if best_key else None
+        api_secret = best_secret[1] if best_secret else None
+
         return api_key, api_secret
 
     def delete_cache(self) -> None:
         """Delete the cached credentials file."""
-        with self._lock:
+        with self._write_lock:
             self._credentials = None
+            self._persisted = None
             try:
                 self._cache_file.unlink(missing_ok=True)
             except OSError:
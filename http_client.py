@@ -8,12 +8,16 @@ Provides a robust HTTP session that:
 - Handles timeouts gracefully
 """
 
+import random
 import time
 import threading
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Optional
-from urllib.parse import urlparse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -22,11 +26,13 @@ from urllib3.util.retry import Retry
 from constants import (
     MAX_RETRIES,
     RETRY_BACKOFF_BASE,
+    MAX_RETRY_AFTER,
     RATE_LIMIT_POMS,
     RATE_LIMIT_TMDB,
     RATE_LIMIT_WEB_SEARCH,
     RATE_LIMIT_VPRO,
     RATE_LIMIT_CINEMA,
+    MAX_RATE_LIMITERS,
 )
 
 logger = logging.getLogger(__name__)
@@ -39,6 +45,99 @@ class RateLimitConfig:
     burst_size: int = 1
 
 
+def _fast_host(url: str) -> str:
+    """
+    Extract the lower-cased network location from a URL.
+
+    A cheap stand-in for urlparse(url).netloc.lower() on the per-request
+    path: slices between "://" and the first "/", "?" or "#".
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Lower-cased host (including port, if any)
+    """
+    start = url.find("://")
+    if start < 0:
+        return url.lower()
+    start += 3
+
+    end = len(url)
+    for sep in "/?#":
+        pos = url.find(sep, start, end)
+        if pos >= 0:
+            end = pos
+    return url[start:end].lower()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (capped at MAX_RETRY_AFTER), or None if absent/invalid
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class JitteredRetry(Retry):
+    """
+    Retry strategy with decorrelated jitter instead of fixed exponential backoff.
+
+    Plain exponential backoff makes threads that failed together retry
+    together. Each wait is instead drawn from
+    uniform(backoff_factor, 3 * previous_wait), capped at the backoff
+    maximum, so retries spread out while still growing on repeated
+    failures. Works on urllib3 1.x and 2.x.
+    """
+
+    _prev_backoff: Optional[float] = None
+    _backoff: Optional[float] = None
+
+    def new(self, **kw) -> "JitteredRetry":
+        retry = super().new(**kw)
+        # Carry the last chosen wait forward; Retry objects are replaced on
+        # every increment()
+        retry._prev_backoff = (
+            self._backoff if self._backoff is not None else self._prev_backoff
+        )
+        return retry
+
+    def get_backoff_time(self) -> float:
+        if super().get_backoff_time() <= 0:
+            return 0
+
+        if self._backoff is None:
+            cap = (
+                getattr(self, "backoff_max", None)
+                or getattr(Retry, "DEFAULT_BACKOFF_MAX", None)
+                or getattr(Retry, "BACKOFF_MAX", 120)
+            )
+            base = self.backoff_factor
+            prev = max(self._prev_backoff or base, base)
+            self._backoff = min(cap, random.uniform(base, prev * 3))
+        return self._backoff
+
+
 class TokenBucketRateLimiter:
     """
     Thread-safe token bucket rate limiter.
@@ -63,6 +162,7 @@ class TokenBucketRateLimiter:
         self.tokens = float(burst_size)
         self.last_update = time.monotonic()
         self._lock = threading.Lock()
+        self._cancel = threading.Event()
 
     def acquire(self, timeout: float = 30.0) -> bool:
         """
@@ -72,36 +172,71 @@ class TokenBucketRateLimiter:
             timeout: Maximum time to wait for a token
 
         Returns:
-            True if token acquired, False if timeout
+            True if token acquired, False if timeout or cancelled
         """
+        # Fast path: token available right away (the common case)
+        wait_time = self._try_take()
+        if wait_time is None:
+            return True
+
         deadline = time.monotonic() + timeout
 
         while True:
-            with self._lock:
-                now = time.monotonic()
-
-                # Refill tokens based on elapsed time
-                elapsed = now - self.last_update
-                self.tokens = min(
-                    self.burst_size,
-                    self.tokens + elapsed * self.rate
-                )
-                self.last_update = now
-
-                if self.tokens >= 1.0:
-                    self.tokens -= 1.0
-                    return True
-
-                # Calculate wait time for next token
-                wait_time = (1.0 - self.tokens) / self.rate
-
             # Check timeout
             if time.monotonic() + wait_time > deadline:
                 logger.warning("Rate limit timeout exceeded")
                 return False
 
-            # Sleep in small increments to allow for cancellation
-            time.sleep(min(wait_time, 0.1))
+            # Sleep until the next token is due; cancel() wakes us early
+            if self._cancel.wait(timeout=wait_time):
+                return False
+
+            wait_time = self._try_take()
+            if wait_time is None:
+                return True
+
+    def _try_take(self) -> Optional[float]:
+        """
+        Refill the bucket and take a token if one is available.
+
+        Returns:
+            None if a token was taken, else seconds until the next token
+        """
+        with self._lock:
+            now = time.monotonic()
+
+            # Refill tokens based on elapsed time
+            elapsed = now - self.last_update
+            self.tokens = min(
+                self.burst_size,
+                self.tokens + elapsed * self.rate
+            )
+            self.last_update = now
+
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return None
+
+            # Calculate wait time for next token
+            return (1.0 - self.tokens) / self.rate
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Drain the bucket so no token is available for `seconds`.
+
+        Used when the server asks us to back off (e.g. 429 + Retry-After);
+        all callers sharing this bucket then wait out the same pause.
+
+        Args:
+            seconds: How long to withhold tokens
+        """
+        with self._lock:
+            self.tokens = min(self.tokens, 1.0 - seconds * self.rate)
+            self.last_update = time.monotonic()
+
+    def cancel(self) -> None:
+        """Wake callers waiting for a token; they return False (for shutdown)."""
+        self._cancel.set()
 
 
 class RateLimitedSession:
@@ -109,19 +244,31 @@ class RateLimitedSession:
     Requests session wrapper with rate limiting, retries, and pooling.
 
     Features:
-    - Connection pooling via HTTPAdapter
+    - Connection pooling via HTTPAdapter, shared across instances
     - Automatic retries with exponential backoff
     - Per-host rate limiting
     - Configurable timeouts
+    - Lazy setup: no pools or adapters until the first request
 
     Usage:
         with RateLimitedSession() as session:
             response = session.get("https://api.example.com/data")
     """
 
-    # Class-level rate limiters shared across all instances
-    _rate_limiters: Dict[str, TokenBucketRateLimiter] = {}
-    _rate_limiter_lock = threading.Lock()
+    # Process-wide requests sessions, keyed by retry/header config, so all
+    # instances with the same config share one set of connection pools
+    _shared_sessions: Dict[Tuple[int, float, Optional[str]], requests.Session] = {}
+    _shared_session_lock = threading.Lock()
+
+    # Class-level rate limiters shared across all instances, sharded by
+    # host hash so creating a limiter only locks one shard. Each shard is
+    # bounded; the oldest limiter is dropped when a shard is full.
+    _RATE_LIMITER_SHARDS = 8
+    _rate_limiter_shards: List[
+        Tuple[threading.Lock, "OrderedDict[str, TokenBucketRateLimiter]"]
+    ] = [
+        (threading.Lock(), OrderedDict()) for _ in range(_RATE_LIMITER_SHARDS)
+    ]
 
     # Default rate limits by domain pattern
     DEFAULT_RATE_LIMITS: Dict[str, RateLimitConfig] = {
@@ -150,15 +297,57 @@ class RateLimitedSession:
             user_agent: Custom user agent string
         """
         self.timeout = timeout
-        self.session = requests.Session()
+        self._max_retries = max_retries
+        self._backoff_factor = backoff_factor
+        self._user_agent = user_agent
+
+        # The underlying requests.Session (pools, adapters, headers) is
+        # shared process-wide and looked up on first request; see
+        # _ensure_session()
+        self.session: Optional[requests.Session] = None
+
+    def _ensure_session(self) -> requests.Session:
+        """
+        Return the underlying requests session, creating it on first use.
+
+        Sessions are shared between all instances with the same retry and
+        user agent settings, so TCP/TLS connections to a host are reused
+        across components.
+
+        Returns:
+            Configured requests.Session
+        """
+        session = self.session
+        if session is not None:
+            return session
+
+        key = (self._max_retries, self._backoff_factor, self._user_agent)
+        with self._shared_session_lock:
+            session = self._shared_sessions.get(key)
+            if session is None:
+                session = self._build_session()
+                self._shared_sessions[key] = session
+
+        self.session = session
+        return session
+
+    def _build_session(self) -> requests.Session:
+        """
+        Create a requests session with retries, pooling and default headers.
+
+        Returns:
+            New requests.Session
+        """
+        session = requests.Session()
 
         # Configure retry strategy
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
+        retry_strategy = JitteredRetry(
+            total=self._max_retries,
+            backoff_factor=self._backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
             raise_on_status=False,
+            respect_retry_after_header=True,
         )
 
         # Configure connection pooling
@@ -167,12 +356,12 @@ class RateLimitedSession:
             pool_connections=10,
             pool_maxsize=20,
         )
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
 
         # Set default headers
-        self.session.headers.update({
-            "User-Agent": user_agent or (
+        session.headers.update({
+            "User-Agent": self._user_agent or (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                 "AppleWebKit/537.36 (KHTML, like Gecko) "
                 "Chrome/120.0.0.0 Safari/537.36"
@@ -181,52 +370,135 @@ class RateLimitedSession:
             "Accept-Language": "nl-NL,nl;q=0.9,en;q=0.8",
         })
 
-    def _get_rate_limiter(self, url: str) -> Optional[TokenBucketRateLimiter]:
+        return session
+
+    def _get_rate_limiter(self, host: str) -> Optional[TokenBucketRateLimiter]:
         """
-        Get or create rate limiter for the URL's host.
+        Get or create rate limiter for a host.
 
         Args:
-            url: URL to get rate limiter for
+            host: Lower-cased host name
 
         Returns:
             Rate limiter for the host, or None if no limit configured
         """
-        host = urlparse(url).netloc.lower()
-
-        # Find matching rate limit config
-        config = None
-        for pattern, cfg in self.DEFAULT_RATE_LIMITS.items():
-            if pattern in host:
-                config = cfg
-                break
-
+        config = self._resolve_config(host)
         if not config:
             return None
 
-        with self._rate_limiter_lock:
-            if host not in self._rate_limiters:
-                self._rate_limiters[host] = TokenBucketRateLimiter(
+        lock, limiters = self._rate_limiter_shards[
+            hash(host) % self._RATE_LIMITER_SHARDS
+        ]
+
+        # Steady state: limiter already exists, no lock needed for the read
+        limiter = limiters.get(host)
+        if limiter is not None:
+            return limiter
+
+        with lock:
+            limiter = limiters.get(host)
+            if limiter is None:
+                limiter = TokenBucketRateLimiter(
                     config.requests_per_second,
                     config.burst_size
                 )
-            return self._rate_limiters[host]
+                limiters[host] = limiter
+                shard_cap = max(1, MAX_RATE_LIMITERS // self._RATE_LIMITER_SHARDS)
+                while len(limiters) > shard_cap:
+                    limiters.popitem(last=False)
+            return limiter
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _resolve_config(host: str) -> Optional[RateLimitConfig]:
+        """
+        Find the rate limit config for a host (memoized per host).
+
+        Matches the configured domain itself or any subdomain of it, so
+        e.g. "www.cinema.nl" matches "cinema.nl" but "cinema.nl.example.com"
+        does not.
+
+        Args:
+            host: Lower-cased host name (may include a port)
 
-    def _apply_rate_limit(self, url: str) -> None:
+        Returns:
+            Matching config, or None if the host is not rate limited
+        """
+        hostname = host.split(":", 1)[0]
+        for pattern, cfg in RateLimitedSession.DEFAULT_RATE_LIMITS.items():
+            if hostname == pattern or hostname.endswith("." + pattern):
+                return cfg
+        return None
+
+    def _apply_rate_limit(self, host: str) -> Optional[TokenBucketRateLimiter]:
         """
         Block until rate limit allows request.
 
         Args:
-            url: URL being requested
+            host: Lower-cased host being requested
+
+        Returns:
+            The host's rate limiter, or None if the host is not rate limited
 
         Raises:
             requests.exceptions.Timeout: If rate limit wait times out
         """
-        limiter = self._get_rate_limiter(url)
+        limiter = self._get_rate_limiter(host)
         if limiter:
             if not limiter.acquire(timeout=60.0):
                 raise requests.exceptions.Timeout(
-                    f"Rate limit timeout for {urlparse(url).netloc}"
+                    f"Rate limit timeout for {host}"
                 )
+        return limiter
+
+    def _handle_throttle(
+        self,
+        host: str,
+        limiter: TokenBucketRateLimiter,
+        response: requests.Response,
+    ) -> None:
+        """
+        Push a server-requested pause into the host's rate limiter.
+
+        If the (post-retry) response is still a 429, honor its Retry-After
+        header so sibling threads stop firing at the host as well.
+
+        Args:
+            host: Host that was requested
+            limiter: The host's rate limiter
+            response: Response received
+        """
+        if response.status_code != 429:
+            return
+
+        delay = _parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            return
+
+        logger.warning(f"Throttled by {host}, backing off {delay:.0f}s")
+        limiter.penalize(delay)
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Make a rate-limited request (shared by get/post).
+
+        The host is parsed once and its limiter resolved once per call.
+
+        Args:
+            method: HTTP method
+            url: URL to request
+            **kwargs: Additional arguments passed to requests
+
+        Returns:
+            Response object
+        """
+        host = _fast_host(url)
+        limiter = self._apply_rate_limit(host)
+        kwargs.setdefault("timeout", self.timeout)
+        response = self._ensure_session().request(method, url, **kwargs)
+        if limiter:
+            self._handle_throttle(host, limiter, response)
+        return response
 
     def get(self, url: str, **kwargs) -> requests.Response:
         """
@@ -239,9 +511,7 @@ class RateLimitedSession:
         Returns:
             Response object
         """
-        self._apply_rate_limit(url)
-        kwargs.setdefault("timeout", self.timeout)
-        return self.session.get(url, **kwargs)
+        return self._request("GET", url, **kwargs)
 
     def post(self, url: str, **kwargs) -> requests.Response:
         """
@@ -254,13 +524,25 @@ class RateLimitedSession:
         Returns:
             Response object
         """
-        self._apply_rate_limit(url)
-        kwargs.setdefault("timeout", self.timeout)
-        return self.session.post(url, **kwargs)
+        return self._request("POST", url, **kwargs)
 
     def close(self) -> None:
-        """Close the session and release resources."""
-        self.session.close()
+        """
+        Release this instance's reference to the shared session.
+
+        The pooled connections stay open for other instances; use
+        close_all() at process shutdown to close them.
+        """
+        self.session = None
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all shared sessions and their connection pools."""
+        with cls._shared_session_lock:
+            sessions = list(cls._shared_sessions.values())
+            cls._shared_sessions.clear()
+        for session in sessions:
+            session.close()
 
     def __enter__(self) -> "RateLimitedSession":
         return self
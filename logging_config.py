@@ -6,15 +6,28 @@ Provides:
 - Structured JSON logging for production
 - Human-readable logging for development
 - Flask middleware for automatic request tracking
+- Queued output so formatting and I/O stay off request threads
 """
 
+import atexit
+import copy
 import logging
+import queue
 import sys
+import time
 import uuid
 import json
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from datetime import datetime, timezone
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Tuple
+
+# Try to import orjson for fast serialization, fall back to stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Context variable for request ID (thread-safe and async-safe)
 request_id_var: ContextVar[str] = ContextVar('request_id', default='system')
@@ -30,7 +43,7 @@ def get_request_id() -> str:
     return request_id_var.get()
 
 
-def set_request_id(request_id: str = None) -> str:
+def set_request_id(request_id: str = None) -> Tuple[str, Token]:
     """
     Set the request ID for the current context.
 
@@ -38,11 +51,64 @@ def set_request_id(request_id: str = None) -> str:
         request_id: Request ID to set. If None, generates a new one.
 
     Returns:
-        The request ID that was set
+        Tuple of (request ID that was set, token for reset_request_id)
     """
     rid = request_id or str(uuid.uuid4())[:8]
-    request_id_var.set(rid)
-    return rid
+    token = request_id_var.set(rid)
+    return rid, token
+
+
+def reset_request_id(token: Token) -> None:
+    """
+    Restore the request ID that was active before set_request_id.
+
+    Args:
+        token: Token returned by set_request_id
+    """
+    request_id_var.reset(token)
+
+
+def _record_request_id(record: logging.LogRecord) -> str:
+    """
+    Get the request ID for a record.
+
+    Prefers the ID captured on the record (records formatted on the queue
+    listener thread no longer see the request's context variable).
+    """
+    return record.__dict__.get('request_id') or get_request_id()
+
+
+class _RequestQueueHandler(QueueHandler):
+    """
+    QueueHandler that captures request context on the calling thread.
+
+    Unlike the stdlib prepare(), this keeps exc_info on the record (the
+    queue is in-process, nothing is pickled) so formatters still render
+    exceptions into their own field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.__dict__.setdefault('request_id', get_request_id())
+        # Merge args now; they may be mutated before the listener runs
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listener that formats and writes queued records
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the background log listener."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -55,12 +121,22 @@ class StructuredFormatter(logging.Formatter):
     Includes additional context fields when available.
     """
 
+    # Extra fields commonly used, copied when set on the record
+    EXTRA_FIELDS = (
+        'duration_ms', 'cache_hit', 'title', 'year',
+        'media_type', 'status_code', 'endpoint', 'method',
+    )
+
     def format(self, record: logging.LogRecord) -> str:
+        # Use the record's creation time: formatting may happen later on
+        # the queue listener thread
+        created = datetime.fromtimestamp(record.created, timezone.utc)
         log_data = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            # orjson serializes datetimes natively (same ISO format)
+            "timestamp": created if HAS_ORJSON else created.isoformat(),
             "level": record.levelname,
             "logger": record.name,
-            "request_id": get_request_id(),
+            "request_id": _record_request_id(record),
             "message": record.getMessage(),
         }
 
@@ -68,15 +144,14 @@ class StructuredFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add extra fields commonly used
-        extra_fields = [
-            'duration_ms', 'cache_hit', 'title', 'year',
-            'media_type', 'status_code', 'endpoint', 'method'
-        ]
-        for key in extra_fields:
-            if hasattr(record, key):
-                log_data[key] = getattr(record, key)
+        # Add extra fields commonly used (plain dict probes on the record)
+        record_dict = record.__dict__
+        for key in self.EXTRA_FIELDS:
+            if key in record_dict:
+                log_data[key] = record_dict[key]
 
+        if HAS_ORJSON:
+            return orjson.dumps(log_data).decode('utf-8')
         return json.dumps(log_data, ensure_ascii=False)
 
 
@@ -103,16 +178,24 @@ class HumanFormatter(logging.Formatter):
         super().__init__()
         self.use_colors = use_colors and sys.stderr.isatty()
 
+        # Pre-rendered (padded, optionally colored) level names
+        self._level_cache = {
+            name: self._render_level(name) for name in self.COLORS
+        }
+
+    def _render_level(self, level: str) -> str:
+        """Pad and optionally colorize a level name."""
+        if self.use_colors:
+            return f"{self.COLORS.get(level, '')}{level:8}{self.RESET}"
+        return f"{level:8}"
+
     def format(self, record: logging.LogRecord) -> str:
-        request_id = get_request_id()
+        request_id = _record_request_id(record)
         prefix = f"[{request_id}] " if request_id != 'system' else ""
 
-        level = record.levelname
-        if self.use_colors:
-            color = self.COLORS.get(level, '')
-            level = f"{color}{level:8}{self.RESET}"
-        else:
-            level = f"{level:8}"
+        level = self._level_cache.get(record.levelname)
+        if level is None:
+            level = self._render_level(record.levelname)
 
         message = record.getMessage()
 
@@ -135,12 +218,18 @@ def configure_logging(
         level: Log level (DEBUG, INFO, WARNING, ERROR)
         structured: Use JSON format for production
         use_colors: Use colored output (only for human format)
+
+    Records are handed to a background QueueListener for formatting and
+    output; it is flushed and stopped at interpreter exit.
     """
+    global _listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper(), logging.INFO))
 
-    # Remove existing handlers
+    # Remove existing handlers (and any listener from a previous call)
     root_logger.handlers.clear()
+    _stop_listener()
 
     # Create handler
     handler = logging.StreamHandler(sys.stdout)
@@ -150,7 +239,12 @@ def configure_logging(
     else:
         handler.setFormatter(HumanFormatter(use_colors=use_colors))
 
-    root_logger.addHandler(handler)
+    # Callers only enqueue records; formatting and writing happen on the
+    # listener thread
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_RequestQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -167,43 +261,50 @@ def setup_flask_request_id(app) -> None:
     - Stores request start time for duration logging
     - Logs request completion with duration
     - Adds X-Request-ID header to responses
+    - Restores the previous request ID on teardown
 
     Args:
         app: Flask application instance
     """
     from flask import request, g
-    from datetime import datetime, timezone
+
+    logger = logging.getLogger('http')
 
     @app.before_request
     def inject_request_id():
         """Inject request ID into context before each request."""
         # Use X-Request-ID header if provided, otherwise generate
         request_id = request.headers.get('X-Request-ID') or str(uuid.uuid4())[:8]
-        set_request_id(request_id)
+        _, g.request_id_token = set_request_id(request_id)
         g.request_id = request_id
-        g.request_start = datetime.now(timezone.utc)
+        g.request_start = time.monotonic()
 
     @app.after_request
     def log_request(response):
         """Log request completion and add request ID header."""
-        duration_ms = (
-            datetime.now(timezone.utc) - g.request_start
-        ).total_seconds() * 1000
-
-        logger = logging.getLogger('http')
-        logger.info(
-            f"{request.method} {request.path} -> {response.status_code} ({duration_ms:.0f}ms)",
-            extra={
-                'method': request.method,
-                'endpoint': request.path,
-                'status_code': response.status_code,
-                'duration_ms': round(duration_ms, 2),
-            }
-        )
+        # Skip timing and record construction when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.monotonic() - g.request_start) * 1000
+            logger.info(
+                f"{request.method} {request.path} -> {response.status_code} ({duration_ms:.0f}ms)",
+                extra={
+                    'method': request.method,
+                    'endpoint': request.path,
+                    'status_code': response.status_code,
+                    'duration_ms': round(duration_ms, 2),
+                }
+            )
 
         response.headers['X-Request-ID'] = g.request_id
         return response
 
+    @app.teardown_request
+    def clear_request_id(exc):
+        """Restore the previous request ID so it can't leak past the request."""
+        token = g.pop('request_id_token', None)
+        if token is not None:
+            reset_request_id(token)
+
 
 class RequestContextAdapter(logging.LoggerAdapter):
     """
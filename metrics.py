@@ -9,12 +9,20 @@ In production, consider replacing with Prometheus client or StatsD.
 
 import time
 import threading
-from collections import defaultdict
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Optional, Tuple
 from contextlib import contextmanager
 
 
+@lru_cache(maxsize=1024)
+def _labeled_key(name: str, labels: FrozenSet[Tuple[str, str]]) -> str:
+    """Build (and memoize) the metric key for a name + label set."""
+    label_str = ",".join(f"{k}={v}" for k, v in sorted(labels))
+    return f"{name}{{{label_str}}}"
+
+
 @dataclass
 class MetricCounter:
     """Thread-safe counter metric."""
@@ -43,54 +51,87 @@ class MetricHistogram:
     Simple histogram for latency/duration tracking.
 
     Tracks count, total, min, max for computing averages.
+
+    observe() does not take the lock: it appends to a pending deque
+    (deque.append is atomic under the GIL). Pending values are folded
+    into the aggregates under the lock when stats are read, or once
+    enough have piled up.
     """
     _count: int = 0
     _total: float = 0.0
     _min: float = float('inf')
     _max: float = 0.0
+    _pending: deque = field(default_factory=deque, repr=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
+    # Fold pending observations once this many have accumulated
+    _DRAIN_THRESHOLD = 1024
+
     def observe(self, value: float) -> None:
         """Record an observation."""
+        self._pending.append(value)
+        if len(self._pending) >= self._DRAIN_THRESHOLD:
+            with self._lock:
+                self._drain()
+
+    def _drain(self) -> None:
+        """Fold pending observations into the aggregates. Caller holds the lock."""
+        pending = self._pending
+        if not pending:
+            return
+
+        count, total, lo, hi = self._count, self._total, self._min, self._max
+        while pending:
+            try:
+                value = pending.popleft()
+            except IndexError:
+                break
+            count += 1
+            total += value
+            if value < lo:
+                lo = value
+            if value > hi:
+                hi = value
+        self._count, self._total, self._min, self._max = count, total, lo, hi
+
+    def _snapshot(self) -> Tuple[int, float, float, float]:
+        """Return (count, total, min, max) taken under a single lock."""
         with self._lock:
-            self._count += 1
-            self._total += value
-            self._min = min(self._min, value)
-            self._max = max(self._max, value)
+            self._drain()
+            return self._count, self._total, self._min, self._max
 
     @property
     def count(self) -> int:
-        with self._lock:
-            return self._count
+        return self._snapshot()[0]
 
     @property
     def avg(self) -> float:
-        with self._lock:
-            return self._total / self._count if self._count > 0 else 0.0
+        count, total, _, _ = self._snapshot()
+        return total / count if count > 0 else 0.0
 
     @property
     def min(self) -> float:
-        with self._lock:
-            return self._min if self._min != float('inf') else 0.0
+        lo = self._snapshot()[2]
+        return lo if lo != float('inf') else 0.0
 
     @property
     def max(self) -> float:
-        with self._lock:
-            return self._max
+        return self._snapshot()[3]
 
     def stats(self) -> Dict[str, float]:
         """Get all stats as dict."""
-        with self._lock:
-            return {
-                "count": self._count,
-                "avg": round(self._total / self._count, 2) if self._count > 0 else 0.0,
-                "min": round(self._min, 2) if self._min != float('inf') else 0.0,
-                "max": round(self._max, 2),
-            }
+        count, total, lo, hi = self._snapshot()
+        return {
+            "count": count,
+            "avg": round(total / count, 2) if count > 0 else 0.0,
+            "min": round(lo, 2) if lo != float('inf') else 0.0,
+            "max": round(hi, 2),
+        }
 
     def reset(self) -> None:
         """Reset histogram."""
         with self._lock:
+            self._pending.clear()
             self._count = 0
             self._total = 0.0
             self._min = float('inf')
@@ -99,7 +140,9 @@ class MetricHistogram:
 
 class Metrics:
     """
-    Thread-safe metrics collector singleton.
+    Thread-safe metrics collector.
+
+    Use the module-level ``metrics`` instance rather than constructing one.
 
     Usage:
         metrics.inc("requests_total", labels={"endpoint": "/search"})
@@ -111,32 +154,33 @@ class Metrics:
         stats = metrics.get_stats()
     """
 
-    _instance: Optional["Metrics"] = None
-    _lock = threading.Lock()
-
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    instance = super().__new__(cls)
-                    instance._initialized = False
-                    cls._instance = instance
-        return cls._instance
-
     def __init__(self):
-        if getattr(self, '_initialized', False):
-            return
-
-        self._counters: Dict[str, MetricCounter] = defaultdict(MetricCounter)
-        self._histograms: Dict[str, MetricHistogram] = defaultdict(MetricHistogram)
-        self._initialized = True
+        self._counters: Dict[str, MetricCounter] = {}
+        self._histograms: Dict[str, MetricHistogram] = {}
+        # Guards creation of new metrics only; lookups of existing ones are lock-free
+        self._create_lock = threading.Lock()
+
+    def _counter(self, key: str) -> MetricCounter:
+        """Get the counter for key, creating it on first use."""
+        counter = self._counters.get(key)
+        if counter is None:
+            with self._create_lock:
+                counter = self._counters.setdefault(key, MetricCounter())
+        return counter
+
+    def _histogram(self, key: str) -> MetricHistogram:
+        """Get the histogram for key, creating it on first use."""
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._create_lock:
+                histogram = self._histograms.setdefault(key, MetricHistogram())
+        return histogram
 
     def _make_key(self, name: str, labels: Optional[Dict[str, str]] = None) -> str:
         """Create metric key with optional labels."""
         if not labels:
             return name
-        label_str = ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        return _labeled_key(name, frozenset(labels.items()))
 
     def inc(self, name: str, amount: int = 1, labels: Optional[Dict[str, str]] = None) -> None:
         """
@@ -148,7 +192,7 @@ class Metrics:
             labels: Optional labels dict
         """
         key = self._make_key(name, labels)
-        self._counters[key].increment(amount)
+        self._counter(key).increment(amount)
 
     def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
         """
@@ -160,7 +204,7 @@ class Metrics:
             labels: Optional labels dict
         """
         key = self._make_key(name, labels)
-        self._histograms[key].observe(value)
+        self._histogram(key).observe(value)
 
     @contextmanager
     def timer(self, name: str, labels: Optional[Dict[str, str]] = None):
@@ -175,12 +219,11 @@ class Metrics:
             with metrics.timer("search_duration_ms"):
                 result = do_search()
         """
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         try:
             yield
         finally:
-            duration_ms = (time.monotonic() - start) * 1000
-            self.observe(name, duration_ms, labels)
+            self.observe(name, (time.perf_counter_ns() - start) / 1_000_000, labels)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -189,21 +232,25 @@ class Metrics:
         Returns:
             Dict with counters and histograms
         """
+        # Copy the registries first: list(dict.items()) is atomic under the
+        # GIL, so a metric created mid-scrape can't break the iteration
+        counters = list(self._counters.items())
+        histograms = list(self._histograms.items())
         return {
-            "counters": {k: v.value for k, v in self._counters.items()},
-            "histograms": {k: v.stats() for k, v in self._histograms.items()},
+            "counters": {k: v.value for k, v in counters},
+            "histograms": {k: v.stats() for k, v in histograms},
         }
 
     def get_counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> int:
         """Get current value of a counter."""
-        key = self._make_key(name, labels)
-        return self._counters[key].value
+        counter = self._counters.get(self._make_key(name, labels))
+        return counter.value if counter is not None else 0
 
     def reset(self) -> None:
         """Reset all metrics."""
-        for counter in self._counters.values():
+        for counter in list(self._counters.values()):
             counter.reset()
-        for histogram in self._histograms.values():
+        for histogram in list(self._histograms.values()):
             histogram.reset()
 
 
@@ -7,16 +7,20 @@ kept separate to avoid circular imports between modules.
 NOTE: This provider only supports MOVIES. TV series support has been removed.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import Optional, List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class VPROFilm:
     """Represents a film with VPRO Cinema metadata.
 
     Note: Despite the name, this only represents movies. TV series support
     has been removed. The media_type field is kept for backward compatibility.
+
+    Uses slots=True (no per-instance __dict__): only declared fields can
+    be set on an instance.
     """
     title: str
     year: Optional[int] = None
@@ -35,20 +39,11 @@ class VPROFilm:
     discovered_imdb: Optional[str] = None  # IMDB found via TMDB lookup
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            'title': self.title,
-            'year': self.year,
-            'director': self.director,
-            'description': self.description,
-            'url': self.url,
-            'imdb_id': self.imdb_id,
-            'vpro_id': self.vpro_id,
-            'genres': self.genres,
-            'vpro_rating': self.vpro_rating,
-            'content_rating': self.content_rating,
-            'images': self.images,
-            'media_type': self.media_type,
-            'lookup_method': self.lookup_method,
-            'discovered_imdb': self.discovered_imdb,
-        }
+        """Convert to dictionary for serialization (all fields, in declaration order)."""
+        return dict(zip(_FILM_FIELDS, _get_film_fields(self)))
+
+
+# Field names and a single C-level getter for all of them, built once from
+# the dataclass definition so to_dict() can't drift from the fields
+_FILM_FIELDS = tuple(f.name for f in fields(VPROFilm))
+_get_film_fields = attrgetter(*_FILM_FIELDS)
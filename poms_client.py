@@ -7,13 +7,19 @@ API-based lookup clients for VPRO Cinema metadata:
 """
 
 import base64
+import contextvars
 import hashlib
 import hmac
+import json
 import logging
 import os
 import re
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Optional, List, Dict, Any, Hashable, Tuple
 from urllib.parse import urlencode
 
 from constants import (
@@ -21,6 +27,13 @@ from constants import (
     POMS_ORIGIN,
     POMS_PROFILE,
     TMDB_API_BASE,
+    TMDB_FETCH_WORKERS,
+    SCRAPE_WORKERS,
+    TMDB_TITLES_CACHE_TTL,
+    TMDB_TITLES_CACHE_ENTRIES,
+    POMS_CACHE_TTL,
+    POMS_SEARCH_CACHE_ENTRIES,
+    POMS_PARSE_CACHE_ENTRIES,
     TITLE_SIMILARITY_THRESHOLD,
     YEAR_TOLERANCE,
 )
@@ -42,9 +55,128 @@ from text_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Try to import orjson for fast response parsing, fall back to stdlib json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+    logger.debug("orjson not available, using stdlib json")
+
+# vprogids.nl page URL: .../film~{id}~{slug}~.html
+_VPROGIDS_URL_RE = re.compile(r'(?:film|serie)~(\d+)~([^~]+)~')
+_VPRO_ID_RE = re.compile(r'(?:film|serie)~(\d+)~')
+# cinema.nl page URL: /db/{id}-{slug}
+_CINEMA_DB_RE = re.compile(r'/db/(\d+)-')
+
+# Search URL up to the max= value, which is the only part that varies
+_POMS_SEARCH_URL_PREFIX = (
+    f"{POMS_API_BASE}/pages/?{urlencode({'profile': POMS_PROFILE})}&max="
+)
+
+# Leading fragment of every POMS signature message, pre-encoded
+_ORIGIN_SIGNATURE_PART = b"origin:" + POMS_ORIGIN.encode('utf-8')
+
 # Environment variables
 TMDB_API_KEY = os.environ.get("TMDB_API_KEY", "")
 
+# Shared pool for issuing independent TMDB requests concurrently
+# (threads are started lazily on first use)
+_tmdb_executor = ThreadPoolExecutor(
+    max_workers=TMDB_FETCH_WORKERS, thread_name_prefix="tmdb"
+)
+
+# Shared pool for cinema.nl page scrapes; the per-host rate limiter still
+# paces the actual requests
+_scrape_executor = ThreadPoolExecutor(
+    max_workers=SCRAPE_WORKERS, thread_name_prefix="scrape"
+)
+
+
+def _scrape_concurrently(fn, *arg_lists) -> List[Any]:
+    """
+    Call fn once per set of arguments on the scrape pool.
+
+    Args:
+        fn: Callable to run
+        *arg_lists: One list per positional argument, zipped together
+
+    Returns:
+        Results in input order (None for calls that raised)
+    """
+    # Run each call in a copy of the caller's context so logs keep the
+    # request ID
+    futures = [
+        _scrape_executor.submit(contextvars.copy_context().run, fn, *args)
+        for args in zip(*arg_lists)
+    ]
+    # Collect every future: one failed page must not discard the others
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            logger.warning(f"Concurrent scrape failed: {e}")
+            results.append(None)
+    return results
+
+
+class _TTLCache:
+    """
+    Small thread-safe in-memory LRU cache with a fixed TTL per entry.
+
+    Values are returned as stored, so callers should store immutable
+    values (or copies).
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum entries kept (least recently used evicted)
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
 
 # =============================================================================
 # TMDB API Client
@@ -66,10 +198,42 @@ class TMDBClient(SessionAwareComponent):
             session: Optional shared session for connection pooling.
         """
         self.api_key = api_key or TMDB_API_KEY
+        # Unconfigured clients short-circuit every lookup before doing any work
+        self._enabled = bool(self.api_key)
         self.init_session(session, timeout=10)
 
     # Preferred countries for alternate titles (relevant for VPRO/Dutch searches)
     PREFERRED_COUNTRIES = ["FR", "NL", "BE", "DE"]
+    _COUNTRY_PRIORITY = {country: i for i, country in enumerate(PREFERRED_COUNTRIES)}
+
+    # Prioritized title lists by TMDB ID, shared across instances (clients
+    # are created per lookup): tmdb_id -> tuple of titles
+    _titles_cache = _TTLCache(TMDB_TITLES_CACHE_TTL, TMDB_TITLES_CACHE_ENTRIES)
+
+    @classmethod
+    def _cached_titles(cls, tmdb_id: int) -> Optional[List[str]]:
+        """
+        Get a cached title list for a TMDB ID.
+
+        Args:
+            tmdb_id: TMDB ID of the movie
+
+        Returns:
+            Copy of the cached titles, or None if absent or expired
+        """
+        titles = cls._titles_cache.get(tmdb_id)
+        return list(titles) if titles is not None else None
+
+    @classmethod
+    def _store_titles(cls, tmdb_id: int, titles: List[str]) -> None:
+        """
+        Cache a title list for a TMDB ID (LRU-bounded, with TTL).
+
+        Args:
+            tmdb_id: TMDB ID of the movie
+            titles: Prioritized titles
+        """
+        cls._titles_cache.put(tmdb_id, tuple(titles))
 
     def _build_prioritized_titles(self, tmdb_id: int) -> List[str]:
         """
@@ -86,31 +250,83 @@ class TMDBClient(SessionAwareComponent):
         Returns:
             List of unique titles in priority order
         """
-        details = self._get(f"/movie/{tmdb_id}")
-        alt_data = self._get(f"/movie/{tmdb_id}/alternative_titles")
+        titles = self._cached_titles(tmdb_id)
+        if titles is not None:
+            return titles
+
+        details, alt_data = self._get_many(
+            f"/movie/{tmdb_id}",
+            f"/movie/{tmdb_id}/alternative_titles",
+        )
+        return self._prioritize_titles(tmdb_id, details, alt_data)
+
+    def _prioritize_titles(
+        self,
+        tmdb_id: int,
+        details: Optional[dict],
+        alt_data: Optional[dict],
+    ) -> List[str]:
+        """
+        Assemble the prioritized title list from TMDB responses.
 
+        The result is cached when both responses arrived (failed requests
+        are not cached so they can be retried).
+
+        Args:
+            tmdb_id: TMDB ID of the movie
+            details: /movie/{id} response (or None)
+            alt_data: /movie/{id}/alternative_titles response (or None)
+
+        Returns:
+            List of unique titles in priority order
+        """
         titles, add_title = build_unique_list(str.lower)
 
         # Priority 1: Original title
         if details:
             add_title(details.get("original_title"))
 
-        # Priority 2: Preferred country titles
+        # Bucket alternate titles in one pass: one bucket per preferred
+        # country (in priority order), plus a final bucket for the rest
         alt_titles = alt_data.get("titles", []) if alt_data else []
-        for country in self.PREFERRED_COUNTRIES:
-            for t in alt_titles:
-                if t.get("iso_3166_1") == country:
-                    add_title(t.get("title"))
-
-        # Priority 3: All remaining titles
+        other = len(self.PREFERRED_COUNTRIES)
+        buckets: List[List[Optional[str]]] = [[] for _ in range(other + 1)]
         for t in alt_titles:
-            add_title(t.get("title"))
+            buckets[self._COUNTRY_PRIORITY.get(t.get("iso_3166_1"), other)].append(
+                t.get("title")
+            )
+
+        # Priority 2: Preferred country titles, then Priority 3: all others
+        for bucket in buckets:
+            for alt_title in bucket:
+                add_title(alt_title)
+
+        if details is not None and alt_data is not None:
+            self._store_titles(tmdb_id, titles)
 
         return titles
 
+    def _get_many(self, *endpoints: str) -> List[Optional[dict]]:
+        """
+        Fetch several TMDB endpoints concurrently.
+
+        Args:
+            *endpoints: Endpoint paths to GET
+
+        Returns:
+            Responses in the same order as endpoints (None on failure)
+        """
+        # Run each call in a copy of the caller's context so logs keep the
+        # request ID
+        futures = [
+            _tmdb_executor.submit(contextvars.copy_context().run, self._get, endpoint)
+            for endpoint in endpoints
+        ]
+        return [future.result() for future in futures]
+
     def _get(self, endpoint: str, params: dict = None) -> Optional[dict]:
         """Make authenticated GET request to TMDB API."""
-        if not self.api_key:
+        if not self._enabled:
             return None
 
         params = params or {}
@@ -120,7 +336,7 @@ class TMDBClient(SessionAwareComponent):
             url = f"{TMDB_API_BASE}{endpoint}"
             response = self.session.get(url, params=params)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             logger.warning(f"TMDB API error: {e}")
             return None
@@ -136,6 +352,9 @@ class TMDBClient(SessionAwareComponent):
         Returns:
             Tuple of (tmdb_id, "film")
         """
+        if not self._enabled:
+            return None, "film"
+
         data = self._get(f"/find/{imdb_id}", {"external_source": "imdb_id"})
         if not data:
             return None, "film"
@@ -166,7 +385,7 @@ class TMDBClient(SessionAwareComponent):
         Returns:
             Tuple of (imdb_id, list of alternate titles including original)
         """
-        if not self.api_key:
+        if not self._enabled:
             return None, []
 
         imdb_id = None
@@ -179,31 +398,37 @@ class TMDBClient(SessionAwareComponent):
             params["year"] = year
         data = self._get("/search/movie", params)
         if data and data.get("results"):
-            # Find best match (prefer exact year match)
-            for result in data["results"]:
-                release_year = None
-                if result.get("release_date"):
-                    try:
-                        release_year = int(result["release_date"][:4])
-                    except (ValueError, IndexError):
-                        pass
-                if year and release_year == year:
-                    tmdb_id = result.get("id")
-                    break
-            if not tmdb_id and data["results"]:
-                tmdb_id = data["results"][0].get("id")
+            results = data["results"]
+            # Find best match (prefer exact year match). Compare the
+            # release_date prefix as a string: no int() / exception per result
+            if year:
+                year_prefix = str(year)
+                for result in results:
+                    if (result.get("release_date") or "")[:4] == year_prefix:
+                        tmdb_id = result.get("id")
+                        break
+            if not tmdb_id:
+                tmdb_id = results[0].get("id")
 
         if not tmdb_id:
             return None, []
 
-        # Get external IDs (IMDB)
-        ext_data = self._get(f"/movie/{tmdb_id}/external_ids")
+        titles = self._cached_titles(tmdb_id)
+        if titles is not None:
+            ext_data = self._get(f"/movie/{tmdb_id}/external_ids")
+        else:
+            # Get external IDs (IMDB) and title data in one concurrent round trip
+            ext_data, details, alt_data = self._get_many(
+                f"/movie/{tmdb_id}/external_ids",
+                f"/movie/{tmdb_id}",
+                f"/movie/{tmdb_id}/alternative_titles",
+            )
+            # Get prioritized titles
+            titles = self._prioritize_titles(tmdb_id, details, alt_data)
+
         if ext_data:
             imdb_id = ext_data.get("imdb_id")
 
-        # Get prioritized titles
-        titles = self._build_prioritized_titles(tmdb_id)
-
         if titles:
             logger.info(f"TMDB search '{title}' ({year}): imdb={imdb_id}, titles={titles[:3]}...")
 
@@ -222,8 +447,7 @@ class TMDBClient(SessionAwareComponent):
         Returns:
             List of alternate titles, prioritized by relevance
         """
-        if not self.api_key:
-            logger.debug("TMDB API key not configured, skipping alternate titles")
+        if not self._enabled:
             return []
 
         tmdb_id, _ = self.find_by_imdb(imdb_id)
@@ -245,6 +469,46 @@ class TMDBClient(SessionAwareComponent):
 # NPO POMS API Client
 # =============================================================================
 
+# Kijkwijzer age ratings accepted from CINEMA_AGERATING relations
+_KIJKWIJZER_RATINGS = frozenset(('AL', '6', '9', '12', '14', '16', '18'))
+
+
+def _rel_year(state: Dict[str, Any], value: Any) -> None:
+    try:
+        state["year"] = int(value)
+    except ValueError:
+        pass
+
+
+def _rel_director(state: Dict[str, Any], value: Any) -> None:
+    state["directors"].append(value)
+
+
+def _rel_appreciation(state: Dict[str, Any], value: Any) -> None:
+    try:
+        state["vpro_rating"] = int(value)
+    except ValueError:
+        pass
+
+
+def _rel_age_rating(state: Dict[str, Any], value: Any) -> None:
+    # Kijkwijzer age rating (e.g., "_16" -> "16", "AL"); first valid one wins
+    if state["content_rating"]:
+        return
+    raw = str(value).lstrip('_')
+    if raw in _KIJKWIJZER_RATINGS:
+        state["content_rating"] = raw
+
+
+# POMS relation type -> handler(state, value), called for non-empty values
+_REL_HANDLERS = {
+    "CINEMA_YEAR": _rel_year,
+    "CINEMA_DIRECTOR": _rel_director,
+    "CINEMA_APPRECIATION": _rel_appreciation,
+    "CINEMA_AGERATING": _rel_age_rating,
+}
+
+
 class POMSAPIClient(SessionAwareComponent):
     """
     NPO POMS REST API client for VPRO Cinema.
@@ -268,21 +532,60 @@ class POMSAPIClient(SessionAwareComponent):
         """
         self.creds = credential_manager or get_credential_manager()
         self.init_session(session, timeout=30)
+        # (secret, keyed HMAC) reused across requests; see _get_hmac()
+        self._hmac_template: Optional[Tuple[str, "hmac.HMAC"]] = None
+        # Page scraper sharing this client's session; see _get_scraper()
+        self._scraper = None
+
+    # Fixed English names for the NPO date format (independent of locale)
+    _WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+    _MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+    # (epoch second, formatted date) shared by all clients; replaced as a
+    # whole, so readers always see a consistent pair
+    _cached_date: Tuple[int, str] = (-1, "")
+
+    # Shared across instances (clients are created per lookup): auto-match
+    # and Fix Match typically search the same title in quick succession.
+    # (query, max_results) -> tuple of raw items
+    _search_cache = _TTLCache(POMS_CACHE_TTL, POMS_SEARCH_CACHE_ENTRIES)
+    # Item page URL -> parsed (and scraped) film; handed out as copies
+    _parse_cache = _TTLCache(POMS_CACHE_TTL, POMS_PARSE_CACHE_ENTRIES)
 
     def _get_npo_date(self) -> str:
-        """Get current timestamp in NPO API format."""
-        return datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        """
+        Get current timestamp in NPO API format.
 
-    def _get_parameters_string(self, params: Dict[str, str]) -> str:
-        """Build sorted parameter string for HMAC signature."""
+        The header only has one-second resolution, so the formatted value
+        is reused until the second changes.
+
+        Returns:
+            Date like "Thu, 15 Oct 2026 10:00:00 GMT"
+        """
+        now = int(time.time())
+        cached = POMSAPIClient._cached_date
+        if cached[0] == now:
+            return cached[1]
+
+        tm = time.gmtime(now)
+        formatted = (
+            f"{self._WEEKDAYS[tm.tm_wday]}, {tm.tm_mday:02d} "
+            f"{self._MONTHS[tm.tm_mon - 1]} {tm.tm_year} "
+            f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d} GMT"
+        )
+        POMSAPIClient._cached_date = (now, formatted)
+        return formatted
+
+    def _get_parameters_string(self, params: Dict[str, str]) -> bytes:
+        """Build sorted parameter string for HMAC signature (UTF-8 encoded)."""
         if not params:
-            return ""
-        sorted_keys = sorted(params.keys())
-        parts = []
-        for key in sorted_keys:
-            if key != "iecomp":
-                parts.append(f",{key}:{params[key]}")
-        return "".join(parts)
+            return b""
+        return b"".join(
+            f",{key}:{params[key]}".encode('utf-8')
+            for key in sorted(params)
+            if key != "iecomp"
+        )
 
     def _get_credentials(
         self,
@@ -301,28 +604,42 @@ class POMSAPIClient(SessionAwareComponent):
         Returns:
             Base64-encoded HMAC signature
         """
-        message_parts = [f"origin:{POMS_ORIGIN}"]
+        # Assembled directly as bytes: no intermediate str message to encode
+        message_parts = [_ORIGIN_SIGNATURE_PART]
 
         if "x-npo-date" in headers:
-            message_parts.append(f"x-npo-date:{headers['x-npo-date']}")
+            message_parts.append(b"x-npo-date:" + headers["x-npo-date"].encode('utf-8'))
 
-        clean_path = path.split("?")[0]
-        uri_part = f"uri:/v1/api/{clean_path}"
+        uri_part = b"uri:/v1/api/" + path.partition("?")[0].encode('utf-8')
 
         if params:
             uri_part += self._get_parameters_string(params)
 
         message_parts.append(uri_part)
-        message = ",".join(message_parts)
 
-        signature = hmac.new(
-            self.creds.api_secret.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        )
+        signature = self._get_hmac()
+        signature.update(b",".join(message_parts))
 
         return base64.b64encode(signature.digest()).decode('utf-8')
 
+    def _get_hmac(self) -> "hmac.HMAC":
+        """
+        Get a fresh HMAC-SHA256 object keyed with the current API secret.
+
+        Keying (deriving the inner/outer pads) is done once per secret;
+        each request copies the keyed template instead of re-keying.
+        Rebuilt automatically when the credentials are refreshed.
+
+        Returns:
+            Keyed HMAC object ready for update()
+        """
+        secret = self.creds.api_secret
+        template = self._hmac_template
+        if template is None or template[0] != secret:
+            template = (secret, hmac.new(secret.encode('utf-8'), None, hashlib.sha256))
+            self._hmac_template = template
+        return template[1].copy()
+
     def _get_headers(self, path: str, params: Dict[str, str] = None) -> Dict[str, str]:
         """Build authenticated request headers."""
         headers = {
@@ -358,7 +675,8 @@ class POMSAPIClient(SessionAwareComponent):
             Tuple of (response, path, params) for potential retry
         """
         path = "pages/"
-        params = {"profile": POMS_PROFILE, "max": str(max_results)}
+        max_str = str(max_results)
+        params = {"profile": POMS_PROFILE, "max": max_str}
 
         body = {
             "highlight": True,
@@ -368,7 +686,7 @@ class POMSAPIClient(SessionAwareComponent):
         }
 
         headers = self._get_headers(path, params)
-        url = f"{POMS_API_BASE}/{path}?{urlencode(params)}"
+        url = _POMS_SEARCH_URL_PREFIX + max_str
 
         response = self.session.post(url, headers=headers, json=body)
         return response, path, params
@@ -383,6 +701,9 @@ class POMSAPIClient(SessionAwareComponent):
         Search VPRO Cinema database.
 
         Automatically refreshes credentials on 401/403 and retries once.
+        If the current credentials were recently rejected, a refresh is
+        tried first and the request is skipped if it doesn't help.
+        Successful results are reused for POMS_CACHE_TTL seconds.
 
         Args:
             query: Search query string
@@ -392,7 +713,20 @@ class POMSAPIClient(SessionAwareComponent):
         Returns:
             List of search result items
         """
+        cache_key = (query, max_results)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            metrics.inc("poms_searches", labels={"status": "cached"})
+            return list(cached)
+
         try:
+            # Don't send a request that is known to come back 401/403
+            if not self.creds.is_valid():
+                if not self.creds.invalidate_and_refresh() or not self.creds.is_valid():
+                    logger.debug("POMS credentials were rejected recently, skipping search")
+                    metrics.inc("poms_searches", labels={"status": "skipped"})
+                    return []
+
             with metrics.timer("poms_search_duration_ms"):
                 response, path, params = self._do_search(query, max_results, media_type)
 
@@ -402,6 +736,7 @@ class POMSAPIClient(SessionAwareComponent):
                     f"POMS API auth failed ({response.status_code}) - refreshing credentials..."
                 )
                 metrics.inc("poms_auth_failures")
+                self.creds.mark_rejected()
 
                 # Invalidate and fetch fresh credentials
                 if self.creds.invalidate_and_refresh():
@@ -410,19 +745,24 @@ class POMSAPIClient(SessionAwareComponent):
 
                     if response.status_code in (401, 403):
                         logger.error("POMS API auth still failing after credential refresh")
+                        self.creds.mark_rejected()
                         return []
                 else:
                     logger.error("Failed to refresh credentials")
                     return []
 
             if response.status_code != 200:
-                logger.error(f"POMS API error {response.status_code}: {response.text[:200]}")
+                # Decode only the logged prefix: response.text would decode the
+                # whole body (running charset detection if none is declared)
+                snippet = response.content[:200].decode('utf-8', errors='replace')
+                logger.error(f"POMS API error {response.status_code}: {snippet}")
                 return []
 
             data = response.json()
             items = data.get("items", [])
             logger.debug(f"POMS API returned {len(items)} results for '{query}'")
             metrics.inc("poms_searches", labels={"status": "success"})
+            self._search_cache.put(cache_key, tuple(items))
             return items
 
         except Exception as e:
@@ -442,9 +782,94 @@ class POMSAPIClient(SessionAwareComponent):
         Returns:
             VPROFilm if parseable movie, None otherwise
         """
-        # Import here to avoid circular import at module level
-        from vpro_scraper import VPROPageScraper
+        film = self._cached_film(item)
+        if film is not None:
+            return film
+
+        parsed = self._parse_item_metadata(item)
+        if parsed is None:
+            return None
+
+        film, scrape_url = parsed
+        if scrape_url:
+            self._enrich_with_scrape(film, scrape_url)
+        self._store_film(item, film)
+        return film
+
+    def parse_items(self, items: List[Dict[str, Any]]) -> List[Optional[VPROFilm]]:
+        """
+        Parse several API response items, scraping their pages concurrently.
+
+        Args:
+            items: Raw API response items
+
+        Returns:
+            VPROFilm (or None) per item, in input order
+        """
+        films = [self._cached_film(item) for item in items]
+        parsed = {
+            i: self._parse_item_metadata(item)
+            for i, item in enumerate(items)
+            if films[i] is None
+        }
+
+        to_scrape = [p for p in parsed.values() if p is not None and p[1]]
+        if to_scrape:
+            _scrape_concurrently(self._enrich_with_scrape, *zip(*to_scrape))
+
+        for i, p in parsed.items():
+            if p is not None:
+                films[i] = p[0]
+                self._store_film(items[i], p[0])
+        return films
+
+    @staticmethod
+    def _item_cache_key(item: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a raw API item: its page URL (None if it has none)."""
+        return item.get("result", {}).get("url") or None
+
+    def _cached_film(self, item: Dict[str, Any]) -> Optional[VPROFilm]:
+        """
+        Get a previously parsed film for an API item.
 
+        Args:
+            item: Raw API response item
+
+        Returns:
+            Copy of the cached film (callers may modify it), or None
+        """
+        key = self._item_cache_key(item)
+        if key is None:
+            return None
+        film = self._parse_cache.get(key)
+        return replace(film) if film is not None else None
+
+    def _store_film(self, item: Dict[str, Any], film: VPROFilm) -> None:
+        """
+        Cache a parsed film for an API item.
+
+        Args:
+            item: Raw API response item
+            film: Parsed and scraped film (a copy is stored)
+        """
+        key = self._item_cache_key(item)
+        if key is not None:
+            self._parse_cache.put(key, replace(film))
+
+    def _parse_item_metadata(
+        self,
+        item: Dict[str, Any],
+    ) -> Optional[Tuple[VPROFilm, Optional[str]]]:
+        """
+        Parse API response item without touching the network.
+
+        Args:
+            item: Raw API response item
+
+        Returns:
+            Tuple of (film, cinema.nl URL to scrape or None), or None if
+            the item is not a movie
+        """
         result = item.get("result", {})
 
         item_type = result.get("type")
@@ -452,32 +877,22 @@ class POMSAPIClient(SessionAwareComponent):
             # Skip series and other types (TV series support removed)
             return None
 
-        year = None
-        directors = []
-        vpro_rating = None
-        content_rating = None
-
-        for rel in result.get("relations", []):
-            rel_type = rel.get("type", "")
-            value = rel.get("value", "")
-
-            if rel_type == "CINEMA_YEAR" and value:
-                try:
-                    year = int(value)
-                except ValueError:
-                    pass
-            elif rel_type == "CINEMA_DIRECTOR" and value:
-                directors.append(value)
-            elif rel_type == "CINEMA_APPRECIATION" and value:
-                try:
-                    vpro_rating = int(value)
-                except ValueError:
-                    pass
-            elif rel_type == "CINEMA_AGERATING" and value and not content_rating:
-                # Kijkwijzer age rating (e.g., "_16" -> "16", "AL")
-                raw = str(value).lstrip('_')
-                if raw in ('AL', '6', '9', '12', '14', '16', '18'):
-                    content_rating = raw
+        state: Dict[str, Any] = {
+            "year": None,
+            "directors": [],
+            "vpro_rating": None,
+            "content_rating": None,
+        }
+
+        # One dict lookup per relation; unknown types are skipped
+        for rel in result.get("relations", ()):
+            handler = _REL_HANDLERS.get(rel.get("type"))
+            if handler is not None:
+                value = rel.get("value")
+                if value:
+                    handler(state, value)
+
+        directors = state["directors"]
 
         genres = [
             g.get("displayName", "")
@@ -511,7 +926,7 @@ class POMSAPIClient(SessionAwareComponent):
             else:
                 logger.warning(f"POMS: Invalid API description for '{result.get('title', 'unknown')}' (len={len(raw_desc)})")
 
-        # Scrape cinema.nl page for description and images
+        # Pick the cinema.nl page to scrape for description and images
         # POMS API returns vprogids.nl image URLs which are now dead (410 Gone),
         # so we prefer images from cinema.nl scraping (images.vpro.nl URLs work)
         scrape_url = None
@@ -521,7 +936,7 @@ class POMSAPIClient(SessionAwareComponent):
             # Convert vprogids.nl URL to cinema.nl URL
             # vprogids.nl: https://www.vprogids.nl/cinema/films/film~16092390~the-penguin-lessons~.html
             # cinema.nl:   https://www.cinema.nl/db/16092390-the-penguin-lessons
-            match = re.search(r'(?:film|serie)~(\d+)~([^~]+)~', url)
+            match = _VPROGIDS_URL_RE.search(url)
             if match:
                 vpro_id_from_url = match.group(1)
                 slug = match.group(2)
@@ -530,46 +945,71 @@ class POMSAPIClient(SessionAwareComponent):
                 )
                 logger.debug(f"POMS: Converted vprogids.nl URL to cinema.nl: {scrape_url}")
 
-        if scrape_url:
-            logger.info(f"POMS: Scraping cinema.nl for '{result.get('title', 'unknown')}' - {scrape_url}")
-            try:
-                scraper = VPROPageScraper(session=self.session)
-                scraped = scraper.scrape(scrape_url)
-                if scraped:
-                    # Use scraped description if we don't have one from API
-                    if not description and scraped.description:
-                        description = scraped.description
-                        logger.info(f"POMS: Got description from page scrape for '{result.get('title', 'unknown')}'")
-                    # Always prefer scraped images (POMS API returns dead vprogids.nl URLs)
-                    if scraped.images:
-                        images = scraped.images
-                        logger.info(f"POMS: Got {len(images)} images from page scrape for '{result.get('title', 'unknown')}'")
-                else:
-                    logger.debug(f"POMS: Page scrape returned no data for '{scrape_url}'")
-            except Exception as e:
-                logger.warning(f"POMS: Page scrape failed for '{scrape_url}': {e}")
-
         vpro_id = None
 
         if url:
-            match = re.search(r'(?:film|serie)~(\d+)~', url)
+            match = _VPRO_ID_RE.search(url)
             if match:
                 vpro_id = match.group(1)
 
-        return VPROFilm(
+        film = VPROFilm(
             title=result.get("title", ""),
-            year=year,
+            year=state["year"],
             director=directors[0] if directors else None,
             description=description,
             url=url,
             imdb_id=None,
             vpro_id=vpro_id,
             genres=genres,
-            vpro_rating=vpro_rating,
-            content_rating=content_rating,
+            vpro_rating=state["vpro_rating"],
+            content_rating=state["content_rating"],
             images=images,
             media_type="film",
         )
+        return film, scrape_url
+
+    def _get_scraper(self):
+        """
+        Get the cinema.nl page scraper for this client, creating it on first use.
+
+        The scraper is stateless apart from the shared session, so it can be
+        used from several scrape threads at once (a racing first call just
+        builds one extra throwaway instance).
+
+        Returns:
+            VPROPageScraper using this client's session
+        """
+        if self._scraper is None:
+            # Import here to avoid circular import at module level
+            from vpro_scraper import VPROPageScraper
+            self._scraper = VPROPageScraper(session=self.session)
+        return self._scraper
+
+    def _enrich_with_scrape(self, film: VPROFilm, scrape_url: str) -> None:
+        """
+        Fill in description and images for a film from its cinema.nl page.
+
+        Args:
+            film: Film parsed from the API (updated in place)
+            scrape_url: cinema.nl page URL
+        """
+        title = film.title or 'unknown'
+        logger.info(f"POMS: Scraping cinema.nl for '{title}' - {scrape_url}")
+        try:
+            scraped = self._get_scraper().scrape(scrape_url)
+            if scraped:
+                # Use scraped description if we don't have one from API
+                if not film.description and scraped.description:
+                    film.description = scraped.description
+                    logger.info(f"POMS: Got description from page scrape for '{title}'")
+                # Always prefer scraped images (POMS API returns dead vprogids.nl URLs)
+                if scraped.images:
+                    film.images = scraped.images
+                    logger.info(f"POMS: Got {len(scraped.images)} images from page scrape for '{title}'")
+            else:
+                logger.debug(f"POMS: Page scrape returned no data for '{scrape_url}'")
+        except Exception as e:
+            logger.warning(f"POMS: Page scrape failed for '{scrape_url}': {e}")
 
     # Backward compatibility alias
     parse_film = parse_item
@@ -617,7 +1057,7 @@ def search_poms_api(
 
         logger.debug(f"POMS API returned {len(items)} results for '{title}'")
 
-        films = [poms.parse_item(item) for item in items]
+        films = poms.parse_items(items)
         # Filter to only films that exist AND have valid descriptions
         films = [f for f in films if f and f.description]
 
@@ -710,7 +1150,7 @@ def search_poms_multiple(
         List of VPROFilm objects with valid descriptions
     """
     # Lazy import to avoid circular dependency
-    from vpro_scraper import CinemaSearcher, VPROPageScraper
+    from vpro_scraper import CinemaSearcher
 
     poms = POMSAPIClient(session=session)
     films = []
@@ -723,8 +1163,7 @@ def search_poms_multiple(
         if items:
             logger.debug(f"POMS multiple: {len(items)} results for '{title}'")
 
-            for item in items:
-                film = poms.parse_item(item)
+            for film in poms.parse_items(items):
                 if not film or not film.description:
                     continue
 
@@ -747,7 +1186,8 @@ def search_poms_multiple(
     try:
         logger.debug(f"Cinema.nl multiple: Searching for '{title}'")
         searcher = CinemaSearcher(session=session)
-        scraper = VPROPageScraper(session=session)
+        # Same scraper (and session) the POMS step used for its items
+        scraper = poms._get_scraper()
 
         # Search cinema.nl (include year for better ranking)
         candidates = searcher.search(title, year)
@@ -755,18 +1195,20 @@ def search_poms_multiple(
         if candidates:
             logger.debug(f"Cinema.nl multiple: {len(candidates)} candidates for '{title}'")
 
+            urls = []
             for candidate in candidates:
                 # Skip if we already have this VPRO ID from POMS
                 # Extract VPRO ID from URL pattern /db/{id}-{slug}
-                vpro_id_match = re.search(r'/db/(\d+)-', candidate.url)
+                vpro_id_match = _CINEMA_DB_RE.search(candidate.url)
                 if vpro_id_match:
                     vpro_id = vpro_id_match.group(1)
                     if vpro_id in seen_vpro_ids:
                         logger.debug(f"Cinema.nl: Skipping duplicate {vpro_id}")
                         continue
+                urls.append(candidate.url)
 
-                # Scrape the detail page
-                film = scraper.scrape(candidate.url)
+            # Scrape the detail pages concurrently, then merge in ranking order
+            for film in _scrape_concurrently(scraper.scrape, urls):
                 if not film or not film.description:
                     continue
 
@@ -774,8 +1216,10 @@ def search_poms_multiple(
                 if film.media_type != "film":
                     continue
 
-                # Add to results
+                # Add to results (two candidates can resolve to the same page)
                 if film.vpro_id:
+                    if film.vpro_id in seen_vpro_ids:
+                        continue
                     seen_vpro_ids.add(film.vpro_id)
 
                 film.lookup_method = "cinema_search"
@@ -9,12 +9,33 @@ import re
 import html
 import hashlib
 import unicodedata
+from functools import lru_cache
 from typing import Optional, List, Any, Callable, TypeVar
 
 from constants import MAX_TITLE_LENGTH
 
 T = TypeVar('T')
 
+# Patterns compiled once at import (used on every title comparison/lookup)
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_UNSAFE_KEY_CHARS = re.compile(r'[^a-z0-9\s-]')
+_WHITESPACE_RUN = re.compile(r'\s+')
+_HYPHEN_RUN = re.compile(r'-+')
+_HTML_TAG = re.compile(r'<[^>]+>')
+_RATING_KEY = re.compile(r'^vpro-[a-z0-9\-]+$')
+_IMDB_ID = re.compile(r'^tt\d{7,}$')
+_IMDB_IN_TEXT = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'imdb-(tt\d{7,})',
+        r'\{imdb-(tt\d{7,})\}',
+        r'\[(tt\d{7,})\]',
+        r'(?<![a-z])(tt\d{7,})(?![0-9])',
+    )
+)
+_YEAR_IN_PARENS = re.compile(r'\((\d{4})\)')
+_YEAR_ANYWHERE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+
 
 # =============================================================================
 # Unicode Normalization
@@ -54,10 +75,13 @@ def normalize_unicode(text: str) -> str:
     return text
 
 
+@lru_cache(maxsize=4096)
 def normalize_for_comparison(text: str) -> str:
     """
     Normalize text for fuzzy comparison.
 
+    Memoized: the same titles are compared against many candidates.
+
     - Lowercase
     - Remove accents (café -> cafe)
     - Remove punctuation
@@ -80,7 +104,7 @@ def normalize_for_comparison(text: str) -> str:
     text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
 
     # Remove punctuation except spaces
-    text = re.sub(r'[^\w\s]', '', text)
+    text = _PUNCTUATION.sub('', text)
 
     # Collapse whitespace
     text = ' '.join(text.split())
@@ -132,9 +156,9 @@ def normalize_for_cache_key(text: str, max_length: int = MAX_TITLE_LENGTH) -> st
     normalized = normalize_for_comparison(text)
 
     # Convert spaces to hyphens, keep only safe chars
-    safe = re.sub(r'[^a-z0-9\s-]', '', normalized)
-    safe = re.sub(r'\s+', '-', safe)
-    safe = re.sub(r'-+', '-', safe).strip('-')
+    safe = _UNSAFE_KEY_CHARS.sub('', normalized)
+    safe = _WHITESPACE_RUN.sub('-', safe)
+    safe = _HYPHEN_RUN.sub('-', safe).strip('-')
 
     if not safe:
         safe = "unknown"
@@ -287,7 +311,7 @@ def sanitize_description(text: str) -> str:
     text = html.unescape(text)
 
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _HTML_TAG.sub('', text)
 
     # Remove control characters (except newlines and tabs)
     text = ''.join(
@@ -411,7 +435,7 @@ def validate_rating_key(key: str) -> bool:
         return False
 
     # Only safe characters (alphanumeric, hyphens)
-    if not re.match(r'^vpro-[a-z0-9\-]+$', key):
+    if not _RATING_KEY.match(key):
         return False
 
     return True
@@ -431,7 +455,7 @@ def validate_imdb_id(imdb_id: str) -> bool:
         return False
 
     # IMDB IDs are tt followed by 7+ digits (currently up to 8, but future-proofed)
-    return bool(re.match(r'^tt\d{7,}$', imdb_id.lower()))
+    return bool(_IMDB_ID.match(imdb_id.lower()))
 
 
 def extract_imdb_from_text(text: str) -> Optional[str]:
@@ -447,15 +471,8 @@ def extract_imdb_from_text(text: str) -> Optional[str]:
     if not text:
         return None
 
-    patterns = [
-        r'imdb-(tt\d{7,})',
-        r'\{imdb-(tt\d{7,})\}',
-        r'\[(tt\d{7,})\]',
-        r'(?<![a-z])(tt\d{7,})(?![0-9])',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _IMDB_IN_TEXT:
+        match = pattern.search(text)
         if match:
             return match.group(1).lower()
 
@@ -476,14 +493,14 @@ def extract_year_from_text(text: str) -> Optional[int]:
         return None
 
     # Look for year in parentheses first (most common)
-    match = re.search(r'\((\d{4})\)', text)
+    match = _YEAR_IN_PARENS.search(text)
     if match:
         year = int(match.group(1))
         if 1888 <= year <= 2100:  # First film was 1888
             return year
 
     # Fallback: any 4-digit year
-    match = re.search(r'\b(19\d{2}|20\d{2})\b', text)
+    match = _YEAR_ANYWHERE.search(text)
     if match:
         return int(match.group(1))
 
@@ -38,6 +38,7 @@ Environment Variables:
 import os
 import re
 import json
+import atexit
 import logging
 import threading
 from dataclasses import dataclass
@@ -59,6 +60,7 @@ from constants import (
 )
 from cache import FileCache, CacheEntry
 from credentials import get_credential_manager
+from http_client import RateLimitedSession
 from text_utils import (
     normalize_for_cache_key,
     validate_rating_key,
@@ -83,8 +85,12 @@ STRUCTURED_LOGGING = os.environ.get("STRUCTURED_LOGGING", "").lower() == "true"
 configure_logging(level=LOG_LEVEL, structured=STRUCTURED_LOGGING)
 logger = logging.getLogger(__name__)
 
-# Initialize cache
+# Initialize cache (sync LRU access times to disk on shutdown)
 cache = FileCache(CACHE_DIR)
+atexit.register(cache.flush)
+
+# Close pooled HTTP connections shared by all RateLimitedSessions
+atexit.register(RateLimitedSession.close_all)
 
 # Match request log for troubleshooting
 MATCH_LOG_FILE = Path(CACHE_DIR) / "match_requests.jsonl"